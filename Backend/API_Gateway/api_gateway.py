@@ -2,11 +2,9 @@
 API Gateway Implementation
 Advanced API Gateway with intelligent request routing, rate limiting, and centralized authentication
 """
-import asyncio
 import json
 import time
-import uuid
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -37,15 +35,15 @@ class ServiceRoute:
     active: bool = True
 
 
-@dataclass
-class RateLimitRule:
-    """Rate limit rule"""
-    client_id: str
-    route_id: str
-    limit: int
-    window_seconds: int
-    current_count: int = 0
-    last_reset: float = 0
+# Fixed-window counter: INCR and first-hit EXPIRE in one atomic round trip,
+# so concurrent gateway instances share a single per-client budget
+RATE_LIMIT_LUA = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return {count, redis.call('TTL', KEYS[1])}
+"""
 
 
 class APIGateway:
@@ -60,7 +58,8 @@ class APIGateway:
         self.route_cache: Dict[str, str] = {}  # path -> route_id
 
         # Rate limiting
-        self.rate_limits: Dict[str, RateLimitRule] = {}
+        self.rate_limit_window = 60  # seconds
+        self._rate_limit_script = self.redis_client.register_script(RATE_LIMIT_LUA)
 
         # Gateway statistics
         self.stats = {
@@ -83,9 +82,6 @@ class APIGateway:
             # Register default routes
             await self.register_default_routes()
 
-            # Start background tasks
-            asyncio.create_task(self.cleanup_expired_limits())
-
             print("✅ API Gateway initialized")
             return True
 
@@ -247,42 +243,22 @@ class APIGateway:
     async def check_rate_limit(self, route_id: str, client_id: str) -> Dict[str, Any]:
         """Check rate limit for client and route"""
         try:
-            limit_key = f"{route_id}:{client_id}"
-            current_time = time.time()
-
-            # Get existing limit rule
-            limit_rule = self.rate_limits.get(limit_key)
-
-            if not limit_rule:
-                # Create new limit rule based on route configuration
-                route = self.routes.get(route_id)
-                if not route:
-                    return {"allowed": True}
-
-                limit_rule = RateLimitRule(
-                    client_id=client_id,
-                    route_id=route_id,
-                    limit=route.rate_limit,
-                    window_seconds=60  # 1 minute window
-                )
-                self.rate_limits[limit_key] = limit_rule
-
-            # Check if window has expired
-            if current_time - limit_rule.last_reset > limit_rule.window_seconds:
-                limit_rule.current_count = 0
-                limit_rule.last_reset = current_time
+            route = self.routes.get(route_id)
+            if not route:
+                return {"allowed": True}
+
+            count, ttl = await self._rate_limit_script(
+                keys=[f"{self.gateway_prefix}:rate_limit:{route_id}:{client_id}"],
+                args=[self.rate_limit_window]
+            )
 
             # Check if limit exceeded
-            if limit_rule.current_count >= limit_rule.limit:
-                retry_after = limit_rule.window_seconds - (current_time - limit_rule.last_reset)
+            if int(count) > route.rate_limit:
                 return {
                     "allowed": False,
-                    "retry_after": max(0, int(retry_after))
+                    "retry_after": max(0, int(ttl))
                 }
 
-            # Increment counter
-            limit_rule.current_count += 1
-
             return {"allowed": True}
 
         except Exception as e:
@@ -375,26 +351,6 @@ class APIGateway:
                 "details": str(e)
             }
 
-    async def cleanup_expired_limits(self):
-        """Clean up expired rate limit rules"""
-        while True:
-            try:
-                current_time = time.time()
-                expired_keys = []
-
-                for key, rule in self.rate_limits.items():
-                    if current_time - rule.last_reset > 3600:  # 1 hour
-                        expired_keys.append(key)
-
-                for key in expired_keys:
-                    del self.rate_limits[key]
-
-                await asyncio.sleep(300)  # Clean up every 5 minutes
-
-            except Exception as e:
-                print(f"Rate limit cleanup error: {e}")
-                await asyncio.sleep(60)
-
     async def get_gateway_statistics(self) -> Dict[str, Any]:
         """Get API Gateway statistics"""
         try:
@@ -404,7 +360,6 @@ class APIGateway:
             return {
                 "gateway_stats": self.stats.copy(),
                 "active_routes": len(self.routes),
-                "active_rate_limits": len(self.rate_limits),
                 "service_mesh_stats": mesh_stats,
                 "timestamp": time.time()
             }
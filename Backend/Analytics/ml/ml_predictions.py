@@ -478,11 +478,13 @@ class MLPredictionsService:
         try:
             # Get all model configurations from Redis
             pattern = f"{self.ml_prefix}:model:*"
-            model_keys = await self.redis_client.keys(pattern)
+            model_keys = [key async for key in self.redis_client.scan_iter(match=pattern, count=500)]
             
-            for model_key in model_keys:
+            # One MGET instead of a GET per model
+            model_values = await self.redis_client.mget(model_keys) if model_keys else []
+
+            for model_key, model_data in zip(model_keys, model_values):
                 model_id = model_key.split(":")[-1]
-                model_data = await self.redis_client.get(model_key)
                 if model_data:
                     model_config = PredictionModelConfig(**json.loads(model_data))
                     self.model_configs[model_id] = model_config
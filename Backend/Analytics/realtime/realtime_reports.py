@@ -372,11 +372,13 @@ class RealTimeReportingService:
         try:
             # Get all report definitions from Redis
             pattern = f"{self.reporting_prefix}:definition:*"
-            report_keys = await self.redis_client.keys(pattern)
+            report_keys = [key async for key in self.redis_client.scan_iter(match=pattern, count=500)]
             
-            for report_key in report_keys:
+            # One MGET instead of a GET per report
+            report_values = await self.redis_client.mget(report_keys) if report_keys else []
+
+            for report_key, report_data in zip(report_keys, report_values):
                 report_id = report_key.split(":")[-1]
-                report_data = await self.redis_client.get(report_key)
                 if report_data:
                     report_def = ReportDefinition(**json.loads(report_data))
                     self.report_definitions[report_id] = report_def
@@ -4,6 +4,7 @@ Complete event-driven system with sagas and asynchronous processing
 """
 import asyncio
 import json
+import random
 import time
 import uuid
 from typing import Dict, Any, List, Optional, Callable
@@ -11,7 +12,17 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 
 from ..Redis.client import get_redis_client
-from ..Message_Broker.message_broker import hybrid_broker
+from ..Message_Broker.message_broker import (
+    hybrid_broker,
+    CONSUMER_RETRY_BASE_DELAY,
+    CONSUMER_RETRY_MAX_DELAY,
+    CONSUMER_ERROR_LOG_INTERVAL,
+    encode_stream_fields,
+    decode_stream_fields
+)
+
+# Nested Event fields, stored as JSON in the event stream
+EVENT_JSON_FIELDS = ("payload", "metadata")
 
 
 class EventType(Enum):
@@ -127,22 +138,30 @@ class EventDrivenSystem:
                 metadata=metadata
             )
 
+            event_data = asdict(event)
+            pipe = self.redis_client.pipeline(transaction=False)
+
             # Store event in Redis
-            await self.redis_client.setex(
+            pipe.setex(
                 f"{self.event_prefix}:event:{event_id}",
                 86400,  # 24 hours
-                json.dumps(asdict(event), default=str)
+                json.dumps(event_data, default=str)
             )
 
-            # Add to event stream
-            await self.redis_client.xadd(
+            # Add to event stream (same round trip as the SETEX). Stream fields must be
+            # flat scalars, so the enum goes by value and nested values as JSON; an
+            # unencodable field would otherwise fail the SETEX along with the XADD
+            stream_fields = encode_stream_fields({**event_data, "event_type": event_type.value})
+            pipe.xadd(
                 f"{self.event_prefix}:stream",
-                asdict(event)
+                stream_fields
             )
 
+            await pipe.execute()
+
             # Publish to message broker
             await hybrid_broker.publish_message(
-                message=asdict(event),
+                message=event_data,
                 routing_key=event_type.value,
                 stream_name="events"
             )
@@ -169,38 +188,59 @@ class EventDrivenSystem:
 
     async def consume_events(self):
         """Consume events from stream"""
+        stream_key = f"{self.event_prefix}:stream"
+        consumer_name = f"consumer_{uuid.uuid4().hex[:8]}"
+
+        # Create consumer group so reads resume where the group left off
+        try:
+            await self.redis_client.xgroup_create(stream_key, "event_group", "$", mkstream=True)
+        except Exception:
+            # Group already exists
+            pass
+
+        retry_delay = CONSUMER_RETRY_BASE_DELAY
+        last_error_log = 0.0
         while True:
             try:
-                # Read events from Redis stream
-                events = await self.redis_client.xread(
-                    {f"{self.event_prefix}:stream": "$"},
-                    count=10,
+                # Block server-side until new events arrive (no client-side polling)
+                events = await self.redis_client.xreadgroup(
+                    "event_group",
+                    consumer_name,
+                    {stream_key: ">"},
+                    count=32,
                     block=5000  # 5 seconds
                 )
+                retry_delay = CONSUMER_RETRY_BASE_DELAY
 
                 for stream_name, stream_events in events:
+                    # Events are processed in stream order; saga steps depend on it
+                    failed = 0
                     for event_id, event_data in stream_events:
                         try:
-                            # Process event
-                            await self.process_event(event_data)
-
-                            # Acknowledge event
-                            await self.redis_client.xack(
-                                f"{self.event_prefix}:stream",
-                                "event_group",
-                                event_id
-                            )
-
-                            self.stats["events_consumed"] += 1
-
+                            # Handlers get payload/metadata as published, not as JSON strings
+                            await self.process_event(decode_stream_fields(event_data, EVENT_JSON_FIELDS))
                         except Exception as e:
-                            print(f"Event processing error: {e}")
+                            # Only ">" is read, so an unacked entry would sit in the pending list forever
+                            failed += 1
+                            print(f"Event processing error (event {event_id} acknowledged and dropped): {e}")
+
+                    # Acknowledge the whole batch, failures included, in a single round trip
+                    if stream_events:
+                        await self.redis_client.xack(
+                            stream_key, "event_group", *(event_id for event_id, _ in stream_events)
+                        )
+                        self.stats["events_consumed"] += len(stream_events) - failed
+                        self.stats["errors"] += failed
 
             except asyncio.TimeoutError:
                 continue
             except Exception as e:
-                print(f"Event consumption error: {e}")
-                await asyncio.sleep(5)
+                now = time.monotonic()
+                if now - last_error_log >= CONSUMER_ERROR_LOG_INTERVAL:
+                    print(f"Event consumption error: {e}")
+                    last_error_log = now
+                await asyncio.sleep(retry_delay + random.uniform(0, retry_delay))
+                retry_delay = min(retry_delay * 2, CONSUMER_RETRY_MAX_DELAY)
 
     async def process_event(self, event_data: Dict[str, Any]):
         """Process individual event"""
@@ -433,13 +473,16 @@ class EventDrivenSystem:
     async def get_event_statistics(self) -> Dict[str, Any]:
         """Get event-driven system statistics"""
         try:
-            # Get recent events
-            event_stream_info = await self.redis_client.xinfo_stream(f"{self.event_prefix}:stream")
+            # Stream info and saga count in a single round trip
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.xinfo_stream(f"{self.event_prefix}:stream")
+            pipe.scard(f"{self.event_prefix}:sagas:active")
+            event_stream_info, active_sagas = await pipe.execute()
 
             return {
                 "event_stats": self.stats.copy(),
                 "event_stream_info": event_stream_info,
-                "active_sagas": await self.redis_client.scard(f"{self.event_prefix}:sagas:active"),
+                "active_sagas": active_sagas,
                 "timestamp": time.time()
             }
 
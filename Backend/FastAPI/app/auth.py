@@ -3,10 +3,11 @@ JWT Authentication Module for FastAPI
 Ultra-advanced security with JWT tokens and comprehensive audit logging
 """
 import os
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 import structlog
-from fastapi import HTTPException, Depends, status
+from fastapi import HTTPException, Depends, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -206,6 +207,11 @@ async def require_auth(current_user: Dict[str, Any] = Depends(get_current_user))
 
     return current_user
 
+async def run_blocking(request: Request, func, *args):
+    """Run a blocking call (bcrypt, etc.) on the app thread pool instead of the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(getattr(request.app.state, "executor", None), func, *args)
+
 def audit_log(action: str, user_id: str, resource: str, details: Dict[str, Any] = None):
     """Structured audit logging for security events"""
     audit_data = {
@@ -1,5 +1,4 @@
 import os
-import time
 import re
 import asyncpg
 from .monitoring import metrics_collector
@@ -73,50 +72,30 @@ def _extract_query_info(sql: str) -> tuple[str, str | None]:
 async def instrumented_fetch(sql: str, *args, pool: asyncpg.Pool | None = None, query_type: str | None = None, table: str | None = None):
     if pool is None:
         pool = await get_pool()
-    start = time.time()
-    try:
-        result = await pool.fetch(sql, *args)
-        return result
-    finally:
-        elapsed = time.time() - start
-        qt, tbl = _extract_query_info(sql)
-        metrics_collector.record_database_query(query_type or qt, table or (tbl or "unknown"), elapsed)
+    qt, tbl = _extract_query_info(sql)
+    with metrics_collector.time_database_query(query_type or qt, table or (tbl or "unknown")):
+        return await pool.fetch(sql, *args)
 
 
 async def instrumented_fetchrow(sql: str, *args, pool: asyncpg.Pool | None = None, query_type: str | None = None, table: str | None = None):
     if pool is None:
         pool = await get_pool()
-    start = time.time()
-    try:
-        result = await pool.fetchrow(sql, *args)
-        return result
-    finally:
-        elapsed = time.time() - start
-        qt, tbl = _extract_query_info(sql)
-        metrics_collector.record_database_query(query_type or qt, table or (tbl or "unknown"), elapsed)
+    qt, tbl = _extract_query_info(sql)
+    with metrics_collector.time_database_query(query_type or qt, table or (tbl or "unknown")):
+        return await pool.fetchrow(sql, *args)
 
 
 async def instrumented_fetchval(sql: str, *args, pool: asyncpg.Pool | None = None, query_type: str | None = None, table: str | None = None):
     if pool is None:
         pool = await get_pool()
-    start = time.time()
-    try:
-        result = await pool.fetchval(sql, *args)
-        return result
-    finally:
-        elapsed = time.time() - start
-        qt, tbl = _extract_query_info(sql)
-        metrics_collector.record_database_query(query_type or qt, table or (tbl or "unknown"), elapsed)
+    qt, tbl = _extract_query_info(sql)
+    with metrics_collector.time_database_query(query_type or qt, table or (tbl or "unknown")):
+        return await pool.fetchval(sql, *args)
 
 
 async def instrumented_execute(sql: str, *args, pool: asyncpg.Pool | None = None, query_type: str | None = None, table: str | None = None):
     if pool is None:
         pool = await get_pool()
-    start = time.time()
-    try:
-        result = await pool.execute(sql, *args)
-        return result
-    finally:
-        elapsed = time.time() - start
-        qt, tbl = _extract_query_info(sql)
-        metrics_collector.record_database_query(query_type or qt, table or (tbl or "unknown"), elapsed)
\ No newline at end of file
+    qt, tbl = _extract_query_info(sql)
+    with metrics_collector.time_database_query(query_type or qt, table or (tbl or "unknown")):
+        return await pool.execute(sql, *args)
\ No newline at end of file
@@ -8,13 +8,18 @@ from fastapi import FastAPI, HTTPException, Request, Depends, status, APIRouter
 from pydantic import BaseModel
 from datetime import datetime, timezone
 from .db_asyncpg import get_pool, init_pool, instrumented_fetch, instrumented_fetchrow
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST
 import time
 import asyncio
+import hashlib
+import inspect
 import os
+import orjson
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 import logging
 # Removed motor import to avoid startup ImportError
 # from motor.motor_asyncio import AsyncIOMotorClient
@@ -23,8 +28,12 @@ logger = logging.getLogger("sec-fastapi")
 _log_level = os.getenv("FASTAPI_LOG_LEVEL", "info").upper()
 logger.setLevel(getattr(logging, _log_level, logging.INFO))
 
+# Environment is fixed for the process lifetime; read it once instead of per request
+_SKIP_DB = os.getenv("FASTAPI_SKIP_DB", "0") in ("1", "true", "True")
+_MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://mongodb:27017/secmongo")
+
 # Prometheus monitoring registry (api_requests_total, api_response_time, etc.)
-from .monitoring import metrics_collector
+from .monitoring import metrics_collector, log_aggregator, configure_logging
 
 # Import security modules
 from .auth import (
@@ -35,13 +44,13 @@ from .auth import (
     security_auditor,
     SecurityAuditor,
     authenticate_user,
-    create_access_token
+    create_access_token,
+    run_blocking
 )
 
 # Import Redis modules
 from .redis import (
     redis_router,
-    advanced_demo_router,
     global_rate_limiting_middleware,
     session_middleware,
     request_logging_middleware,
@@ -62,6 +71,7 @@ from .redis import (
     ultra_analytics_engine,
     get_redis_client,
     test_redis_connection,
+    close_redis_connection,
     EventType
 )
 
@@ -71,13 +81,16 @@ from .routes.ai_router import ai_router
 
 # Import service registration
 import sys
-import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
+# The *_AVAILABLE flags let lifespan skip scheduling tasks for the no-op fallbacks
 try:
     from Backend.Service_Registration import register_current_service, unregister_current_service
+    _SERVICE_REGISTRATION_AVAILABLE = True
 except ImportError:
     # Create mock functions if Backend module is not available
+    _SERVICE_REGISTRATION_AVAILABLE = False
+
     async def register_current_service():
         return None
 
@@ -87,8 +100,11 @@ except ImportError:
 # Import message broker
 try:
     from Backend.Message_Broker.message_handler import message_handler
+    _MESSAGE_HANDLER_AVAILABLE = True
 except ImportError:
     # Create mock object if Backend module is not available
+    _MESSAGE_HANDLER_AVAILABLE = False
+
     class MockMessageHandler:
         async def initialize(self):
             pass
@@ -97,68 +113,58 @@ except ImportError:
 
 # Import OpenTelemetry for tracing
 from opentelemetry import trace
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-# Prefer OTLP exporter to avoid Jaeger deprecation
-try:
-    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-except Exception:
-    OTLPSpanExporter = None
 
-# Initialize tracing
-trace.set_tracer_provider(TracerProvider())
+# Tracer provider and span exporter are configured once by monitoring.JaegerTracerManager
 tracer = trace.get_tracer(__name__)
 
-# OTLP exporter for tracing (avoids Jaeger deprecation)
-if OTLPSpanExporter is not None:
-    try:
-        otlp_exporter = OTLPSpanExporter()
-        span_processor = BatchSpanProcessor(otlp_exporter)
-        trace.get_tracer_provider().add_span_processor(span_processor)
-    except Exception:
-        pass
-
 # Initialize FastAPI instrumentation
 FastAPIInstrumentor.instrument_app
 
-# Import service registration
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+# Wall-clock time refreshed every 100 ms by a lifespan task; response timestamps
+# only need coarse resolution, so hot endpoints read this instead of time.time()
+_now: float = time.time()
+_clock_running = False
 
-try:
-    from Backend.Service_Registration import register_current_service, unregister_current_service
-except ImportError:
-    # Create mock functions if Backend module is not available
-    async def register_current_service():
-        return None
-    
-    async def unregister_current_service():
-        return None
 
-# Import message broker
-try:
-    from Backend.Message_Broker.message_handler import message_handler
-except ImportError:
-    # Create mock object if Backend module is not available
-    class MockMessageHandler:
-        async def initialize(self):
-            pass
-    
-    message_handler = MockMessageHandler()
+def _wall_time() -> float:
+    """Cached wall-clock time while the tick task runs; time.time() without lifespan"""
+    return _now if _clock_running else time.time()
+
+
+async def _clock_tick():
+    """Keep the cached wall-clock timestamp fresh"""
+    global _now, _clock_running
+    try:
+        while True:
+            _now = time.time()
+            _clock_running = True
+            await asyncio.sleep(0.1)
+    finally:
+        _clock_running = False
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
+    # JSON log rendering is opted into here, before the first log line is emitted
+    configure_logging()
     print("🚀 Starting FastAPI with Ultra-Advanced Redis Integration...")
+    # Keep a handle on every background task so shutdown can cancel them cleanly
+    background_tasks = [asyncio.create_task(_clock_tick())]
+    # Thread pool for blocking work (bcrypt) so it never stalls the event loop
+    app.state.executor = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2)
+    # Bound the endpoint metric label to the app's route templates
+    metrics_collector.register_routes(app.routes)
+    # Metrics are registered at import; their collectors run on this loop
+    await metrics_collector.start()
+    await log_aggregator.start()
 
     # Dev flags to skip external dependencies during local development
     _skip_redis = os.getenv("FASTAPI_SKIP_REDIS", "0") == "1"
     # Always default to using DB; only skip if explicitly set
-    _skip_db = os.getenv("FASTAPI_SKIP_DB", "0") in ("1", "true", "True")
+    _skip_db = _SKIP_DB
 
     # Test Redis connection (await the coroutine properly)
     if _skip_redis:
@@ -176,6 +182,12 @@ async def lifespan(app: FastAPI):
         print("⚠️  Redis not available, continuing startup in degraded dev mode")
     else:
         print("✅ Redis connected successfully")
+        try:
+            await rate_limiter.initialize()
+            print("✅ Rate limiter scripts loaded")
+        except Exception as _e:
+            # Scripts are loaded on first use instead
+            print(f"⚠️  Rate limiter script preload failed: {_e}")
 
     # Initialize Postgres connection pool for SEC CRUD if not skipped
     if _skip_db:
@@ -191,20 +203,29 @@ async def lifespan(app: FastAPI):
 
     # Initialize ultra-advanced integrations
     try:
-        # Initialize PostgreSQL cache manager
-        await postgres_cache_manager.initialize()
-        print("✅ PostgreSQL Ultra-Cache Manager initialized")
-
-        # Initialize MongoDB cache manager
-        await mongodb_cache_manager.initialize()
-        print("✅ MongoDB Ultra-Cache Manager initialized")
-
-        # Initialize hybrid message broker
+        # Independent network/DB setups run concurrently: startup costs max() instead of sum()
+        # (name, coroutine, required) - only required components abort startup on failure
+        init_steps = [
+            ("PostgreSQL Ultra-Cache Manager", postgres_cache_manager.initialize(), True),
+            ("MongoDB Ultra-Cache Manager", mongodb_cache_manager.initialize(), True),
+        ]
         if hybrid_broker is not None:
-            await hybrid_broker.initialize()
-            print("✅ Hybrid Message Broker initialized")
+            init_steps.append(("Hybrid Message Broker", hybrid_broker.initialize(), False))
         else:
             print("⚠️  Hybrid Message Broker not available")
+        if ultra_security_manager is not None:
+            init_steps.append(("Ultra-Advanced Security System", ultra_security_manager.initialize_security_system(), False))
+        else:
+            print("⚠️  Ultra-Advanced Security System not available")
+
+        init_results = await asyncio.gather(*(coro for _, coro, _ in init_steps), return_exceptions=True)
+        for (name, _, required), result in zip(init_steps, init_results):
+            if isinstance(result, BaseException):
+                print(f"❌ {name} initialization failed: {result}")
+                if required:
+                    raise result
+            else:
+                print(f"✅ {name} initialized")
 
         # Initialize global service mesh
         if global_service_mesh is not None:
@@ -212,13 +233,6 @@ async def lifespan(app: FastAPI):
         else:
             print("⚠️  Global Service Mesh not available")
 
-        # Initialize ultra-security system
-        if ultra_security_manager is not None:
-            await ultra_security_manager.initialize_security_system()
-            print("✅ Ultra-Advanced Security System initialized")
-        else:
-            print("⚠️  Ultra-Advanced Security System not available")
-
         # Initialize ultra-AI manager
         if ultra_ai_manager is not None:
             print("✅ Ultra-AI Manager initialized")
@@ -233,32 +247,35 @@ async def lifespan(app: FastAPI):
 
         # Start session cluster heartbeat
         if session_cluster is not None:
-            asyncio.create_task(session_cluster.start_heartbeat())
+            background_tasks.append(asyncio.create_task(session_cluster.start_heartbeat()))
             print("✅ Session Clustering active")
         else:
             print("⚠️  Session Clustering not available")
 
         # Start global service mesh monitoring
         if global_service_mesh is not None:
-            asyncio.create_task(global_service_mesh.start_global_monitoring())
+            background_tasks.append(asyncio.create_task(global_service_mesh.start_global_monitoring()))
             print("✅ Global Service Mesh monitoring active")
         else:
             print("⚠️  Global Service Mesh monitoring not available")
 
         # Start continuous security monitoring
         if ultra_security_manager is not None:
-            asyncio.create_task(ultra_security_manager.start_continuous_monitoring())
+            background_tasks.append(asyncio.create_task(ultra_security_manager.start_continuous_monitoring()))
             print("✅ Ultra-Security monitoring active")
         else:
             print("⚠️  Ultra-Security monitoring not available")
 
         # Register service with service mesh and registry
-        asyncio.create_task(register_current_service())
-        print("✅ Service registration task started")
+        if _SERVICE_REGISTRATION_AVAILABLE:
+            background_tasks.append(asyncio.create_task(register_current_service()))
+            print("✅ Service registration task started")
+        else:
+            print("⚠️  Service registration not available")
 
         # Initialize message handler
-        if message_handler is not None:
-            asyncio.create_task(message_handler.initialize())
+        if _MESSAGE_HANDLER_AVAILABLE and message_handler is not None:
+            background_tasks.append(asyncio.create_task(message_handler.initialize()))
             print("✅ Message handler initialized")
         else:
             print("⚠️  Message handler not available")
@@ -273,10 +290,17 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("🔄 Shutting down ultra-advanced Redis features...")
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await metrics_collector.stop()
+    await log_aggregator.stop()
+    app.state.executor.shutdown(wait=False)
 
     # Unregister service
-    await unregister_current_service()
-    print("✅ Service unregistration completed")
+    if _SERVICE_REGISTRATION_AVAILABLE:
+        await unregister_current_service()
+        print("✅ Service unregistration completed")
 
     # Close database connections
     if postgres_cache_manager is not None:
@@ -286,20 +310,34 @@ async def lifespan(app: FastAPI):
     if hybrid_broker is not None:
         await hybrid_broker.close()
 
+    # Release the shared Redis connection pool
+    await close_redis_connection()
+
 
 # Create FastAPI app with lifespan management
 app = FastAPI(
     title="FastAPI + Ultra-Advanced Redis Integration",
     description="Revolutionary application with complete Redis ecosystem",
     version="4.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Probe/scrape endpoints are excluded from request metrics
+_METRICS_SKIP_PATHS = {"/metrics", "/health", "/health/live"}
+
+
+def _route_template(request: Request) -> str:
+    """Route template (e.g. /usuarios/{id}) for low-cardinality metric labels"""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unknown"
+
+
 # Security middleware configuration
 @app.middleware("http")
 async def security_middleware(request: Request, call_next):
     """Enhanced security middleware with audit logging"""
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Get client information
     client_ip = request.client.host if request.client else "unknown"
@@ -321,34 +359,36 @@ async def security_middleware(request: Request, call_next):
         response = await call_next(request)
 
         # Calculate processing time
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
 
         # Log response
         logger.info(f"Request completed method={request.method} url={request.url.path} status_code={response.status_code} process_time={process_time:.3f}s")
 
         # Record Prometheus metrics for this request
         try:
-            metrics_collector.record_api_request(
-                endpoint=request.url.path,
-                method=request.method,
-                status_code=response.status_code,
-                response_time=process_time
-            )
-
-            # Record error counter for 4xx/5xx statuses
-            try:
-                if 400 <= int(response.status_code) < 500:
-                    metrics_collector.record_error(
-                        error_type="client_error",
-                        endpoint=request.url.path
-                    )
-                elif 500 <= int(response.status_code) < 600:
-                    metrics_collector.record_error(
-                        error_type="server_error",
-                        endpoint=request.url.path
-                    )
-            except Exception as _inner:
-                logger.debug(f"Error metric recording failed: {_inner}")
+            if request.url.path not in _METRICS_SKIP_PATHS:
+                endpoint = _route_template(request)
+                metrics_collector.record_api_request(
+                    endpoint=endpoint,
+                    method=request.method,
+                    status_code=response.status_code,
+                    response_time=process_time
+                )
+
+                # Record error counter for 4xx/5xx statuses
+                try:
+                    if 400 <= int(response.status_code) < 500:
+                        metrics_collector.record_error(
+                            error_type="client_error",
+                            endpoint=endpoint
+                        )
+                    elif 500 <= int(response.status_code) < 600:
+                        metrics_collector.record_error(
+                            error_type="server_error",
+                            endpoint=endpoint
+                        )
+                except Exception as _inner:
+                    logger.debug(f"Error metric recording failed: {_inner}")
         except Exception as _e:
             # Avoid breaking request on metrics failure
             logger.debug(f"Metrics recording failed: {_e}")
@@ -370,7 +410,7 @@ async def security_middleware(request: Request, call_next):
         try:
             metrics_collector.record_error(
                 error_type="exception",
-                endpoint=request.url.path
+                endpoint=_route_template(request)
             )
         except Exception as _inner_e:
             logger.debug(f"Exception error metric recording failed: {_inner_e}")
@@ -414,9 +454,8 @@ app.middleware("http")(global_rate_limiting_middleware)
 app.middleware("http")(session_middleware)
 app.middleware("http")(request_logging_middleware)
 
-# Include Redis advanced features routers
+# Include Redis advanced features router
 app.include_router(redis_router)
-app.include_router(advanced_demo_router)
 # Include Auth router
 app.include_router(auth_router)
 # Include AI router
@@ -428,20 +467,10 @@ async def redis_test():
     """Basic Redis connectivity test endpoint used by integration tests
     Returns 200 if Redis ping succeeds, otherwise 503.
     """
-    try:
-        # Prefer the packaged test function if available
-        from app.redis import test_redis_connection as _test_conn  # type: ignore
-    except Exception:
-        try:
-            # Fallback to local client implementation
-            from app.redis.local_redis_client import test_redis_connection as _test_conn  # type: ignore
-        except Exception:
-            async def _test_conn() -> bool:
-                return False
-    ok = await _test_conn()
+    ok = await test_redis_connection()
     if ok:
         return {"status": "ok"}
-    return JSONResponse(status_code=503, content={"status": "unavailable"})
+    return ORJSONResponse(status_code=503, content={"status": "unavailable"})
 
 
 
@@ -459,45 +488,51 @@ async def protected(current_user: Dict[str, Any] = Depends(require_auth)):
     return {"status": "ok"}
 
 
+# Static payloads serialized once at import; only the timestamp varies per call
+_ROOT_BODY_PREFIX = orjson.dumps({
+    "message": "FastAPI with Ultra-Advanced Redis Integration",
+    "status": "revolutionary",
+    "redis_ecosystem": [
+        "Global Service Mesh (Multi-region)",
+        "AI-Powered Everything (Machine Learning)",
+        "Ultra-Advanced Security (Military-grade)",
+        "Advanced Real-time Communication (WebRTC + Gaming)",
+        "Global Analytics (Business Intelligence)",
+        "Advanced Event Sourcing (CQRS)",
+        "Advanced Message Analytics (Throughput monitoring)",
+        "Advanced Search Engine (Full-text + Vector)",
+        "Ultra Database Caching (PostgreSQL + MongoDB)",
+        "Advanced Monitoring Stack (Grafana + Prometheus + Loki)",
+        "Advanced Data Structures",
+        "Advanced Rate Limiting",
+        "Advanced Session Clustering"
+    ],
+    "ultra_features": {
+        "global_service_mesh": "Multi-region architecture with geographic load balancing",
+        "ultra_ai": "Machine learning integration for intelligent decision making",
+        "ultra_security": "Military-grade security with zero-trust architecture",
+        "realtime_communication": "WebRTC + gaming with collaborative editing",
+        "global_analytics": "Business intelligence with predictive analytics",
+        "advanced_search": "Full-text search with vector similarity",
+        "ultra_monitoring": "Advanced monitoring with ML-powered insights"
+    },
+    "endpoints": {
+        "ultra_demo": "/redis-advanced/demo/{user_id}",
+        "global_health": "/redis-advanced/global/health",
+        "ai_insights": "/redis-advanced/ai/insights",
+        "security_report": "/redis-advanced/security/report",
+        "analytics_dashboard": "/redis-advanced/analytics/dashboard",
+        "service_mesh_status": "/redis-advanced/mesh/status"
+    }
+})[:-1]
+
+
 @app.get("/")
 async def root():
-    return {
-        "message": "FastAPI with Ultra-Advanced Redis Integration",
-        "status": "revolutionary",
-        "redis_ecosystem": [
-            "Global Service Mesh (Multi-region)",
-            "AI-Powered Everything (Machine Learning)",
-            "Ultra-Advanced Security (Military-grade)",
-            "Advanced Real-time Communication (WebRTC + Gaming)",
-            "Global Analytics (Business Intelligence)",
-            "Advanced Event Sourcing (CQRS)",
-            "Advanced Message Analytics (Throughput monitoring)",
-            "Advanced Search Engine (Full-text + Vector)",
-            "Ultra Database Caching (PostgreSQL + MongoDB)",
-            "Advanced Monitoring Stack (Grafana + Prometheus + Loki)",
-            "Advanced Data Structures",
-            "Advanced Rate Limiting",
-            "Advanced Session Clustering"
-        ],
-        "ultra_features": {
-            "global_service_mesh": "Multi-region architecture with geographic load balancing",
-            "ultra_ai": "Machine learning integration for intelligent decision making",
-            "ultra_security": "Military-grade security with zero-trust architecture",
-            "realtime_communication": "WebRTC + gaming with collaborative editing",
-            "global_analytics": "Business intelligence with predictive analytics",
-            "advanced_search": "Full-text search with vector similarity",
-            "ultra_monitoring": "Advanced monitoring with ML-powered insights"
-        },
-        "endpoints": {
-            "ultra_demo": "/redis-advanced/demo/{user_id}",
-            "global_health": "/redis-advanced/global/health",
-            "ai_insights": "/redis-advanced/ai/insights",
-            "security_report": "/redis-advanced/security/report",
-            "analytics_dashboard": "/redis-advanced/analytics/dashboard",
-            "service_mesh_status": "/redis-advanced/mesh/status"
-        },
-        "timestamp": time.time()
-    }
+    return Response(
+        _ROOT_BODY_PREFIX + b',"timestamp":' + orjson.dumps(_wall_time()) + b"}",
+        media_type="application/json"
+    )
 
 
 # ===================== Permissões (Efetivas por Usuário) =====================
@@ -588,7 +623,7 @@ def _raw_to_matrix(raw: List[PermissaoItem]) -> PermissionMatrixOut:
 @permissoes_router.get("/usuarios/{id}", response_model=UserPermissionsResponse)
 async def obter_permissoes_usuario_endpoint(id: int, current_user: Dict[str, Any] = Depends(require_auth)):
     # Fallback sem banco para desenvolvimento
-    if os.getenv("FASTAPI_SKIP_DB", "0") in ("1", "true", "True"):
+    if _SKIP_DB:
         usr = None
         for u in FAKE_USERS:
             if u["IdUsuario"] == id:
@@ -676,9 +711,26 @@ async def obter_permissoes_usuario_endpoint(id: int, current_user: Dict[str, Any
 
 
 
+def _etag(body: bytes) -> str:
+    """Strong ETag for a pre-serialized response body"""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+def _static_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a fixed JSON body, or 304 when the client already holds it"""
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+_HEALTH_ETAG = _etag(_HEALTH_BODY)
+
+
 @app.get("/health")
-async def health():
-    return {"status": "healthy"}
+async def health(request: Request):
+    return _static_json_response(request, _HEALTH_BODY, _HEALTH_ETAG)
 
 
 @app.get("/health/ready")
@@ -686,9 +738,9 @@ async def readiness_probe():
     """Readiness probe for Kubernetes compatibility"""
     try:
         # Test Redis connection
-        redis_connected = test_redis_connection()
+        redis_connected = await test_redis_connection()
         if not redis_connected:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={"status": "not_ready", "reason": "Redis connection failed"}
             )
@@ -698,14 +750,14 @@ async def readiness_probe():
         mongodb_ready = hasattr(mongodb_cache_manager, 'initialize')
         
         if not postgres_ready or not mongodb_ready:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={"status": "not_ready", "reason": "Database connections not ready"}
             )
         
         return {"status": "ready", "service": "fastapi-redis"}
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={"status": "not_ready", "reason": str(e)}
         )
@@ -716,72 +768,112 @@ async def liveness_probe():
     """Liveness probe for Kubernetes compatibility"""
     try:
         # Simple check to see if the application is responding
-        return {"status": "alive", "service": "fastapi-redis", "timestamp": time.time()}
+        return {"status": "alive", "service": "fastapi-redis", "timestamp": _wall_time()}
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"status": "dead", "reason": str(e)}
         )
 
-@app.get("/health/db")
-async def database_health():
-    """Database health status for Postgres and MongoDB"""
-    status = {}
-    # Check PostgreSQL via asyncpg pool
-    try:
-        pool = await get_pool()
-        async with pool.acquire() as conn:
-            val = await conn.fetchval('SELECT 1')
-        status["postgres"] = bool(val == 1)
-    except Exception as e:
-        status["postgres"] = False
-        status["postgres_error"] = str(e)
+async def _check_postgres() -> bool:
+    """Check PostgreSQL via asyncpg pool"""
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        val = await conn.fetchval('SELECT 1')
+    return val == 1
+
 
-    # Check MongoDB via PyMongo ping (non-async)
+def _ping_mongodb() -> bool:
+    """Check MongoDB via PyMongo ping (blocking; run on the thread pool)"""
+    from pymongo import MongoClient
+    client = MongoClient(_MONGODB_URL, serverSelectionTimeoutMS=2000)
     try:
-        import os
-        from pymongo import MongoClient
-        mongo_url = os.getenv("MONGODB_URL", "mongodb://mongodb:27017/secmongo")
-        client = MongoClient(mongo_url, serverSelectionTimeoutMS=2000)
         ping = client.admin.command("ping")
-        status["mongodb"] = ping.get("ok", 0) == 1
+        return ping.get("ok", 0) == 1
+    finally:
         client.close()
-    except Exception as e:
-        status["mongodb"] = False
-        status["mongodb_error"] = str(e)
+
+
+@app.get("/health/db")
+async def database_health(request: Request):
+    """Database health status for Postgres and MongoDB"""
+    # Both checks run concurrently; the blocking Mongo ping stays off the event loop
+    results = await asyncio.gather(
+        _check_postgres(),
+        run_blocking(request, _ping_mongodb),
+        return_exceptions=True
+    )
+    status = {}
+    for name, result in zip(("postgres", "mongodb"), results):
+        if isinstance(result, Exception):
+            status[name] = False
+            status[f"{name}_error"] = str(result)
+        else:
+            status[name] = bool(result)
 
     status["status"] = "healthy" if (status.get("postgres") and status.get("mongodb")) else "degraded"
-    status["timestamp"] = time.time()
+    status["timestamp"] = _wall_time()
     return status
 
 @app.get("/api/v1/health/db")
-async def database_health_v1():
-    return await database_health()
+async def database_health_v1(request: Request):
+    return await database_health(request)
 
 
-@app.get("/metrics")
-async def metrics():
-    """Prometheus metrics endpoint"""
+# Rendered /metrics payload is reused for a short window so overlapping scrapes
+# (replicas, federated scrapers) collapse into a single render
+_METRICS_CACHE_TTL = 0.5
+_metrics_cache = (0.0, b"")
+_metrics_lock = asyncio.Lock()
+
+
+async def _component_stats(component, method: str, default: Dict[str, Any]) -> Dict[str, Any]:
+    """Stats from one component, or its defaults if it is missing or its stats call fails"""
+    stats_fn = getattr(component, method, None) if component is not None else None
+    if stats_fn is None:
+        return default
     try:
-        # Include counters/histograms from monitoring registry
-        registry_metrics_text = metrics_collector.get_all_metrics()
+        return await stats_fn()
+    except Exception as e:
+        print(f"⚠️  {method} indisponível para /metrics: {e}")
+        return default
+
+
+async def _render_metrics() -> bytes:
+    """Render the Prometheus exposition text as UTF-8 bytes"""
+    try:
+        # Include counters/histograms from monitoring registry (already encoded)
+        registry_metrics = metrics_collector.get_all_metrics()
 
         # Get various metrics from different components
         cache_stats = api_cache_manager.get_cache_stats()
-        session_stats = await session_cluster.get_session_stats()
         rate_limit_stats = rate_limiter.get_rate_limit_stats()
         postgres_stats = postgres_cache_manager.get_cache_stats()
         mongodb_stats = mongodb_cache_manager.get_cache_stats()
-        broker_stats = await hybrid_broker.get_message_stats() if hybrid_broker is not None else {"queue_size": 0, "processing_rate": 0}
-        event_stats = await event_sourcing_manager.get_event_stats() if event_sourcing_manager is not None else {"processed_events": 0, "processing_latency": 0}
         prometheus_stats = prometheus_cache_manager.get_cache_stats()
-        global_mesh_stats = await global_service_mesh.get_global_mesh_analytics() if global_service_mesh is not None else {"active_nodes": 0, "requests_processed": 0}
-        ai_stats = await ultra_ai_manager.get_ai_system_overview() if ultra_ai_manager is not None else {"model_accuracy": 0, "predictions_made": 0}
-        security_stats = await ultra_security_manager.get_comprehensive_security_report() if ultra_security_manager is not None else {"threats_detected": 0, "authentications": 0}
-        analytics_stats = await ultra_analytics_engine.get_business_intelligence_dashboard() if ultra_analytics_engine is not None else {"data_points_processed": 0, "insights_generated": 0}
+        # Async component stats are independent: one concurrent round instead of seven.
+        # Each call is guarded, so one failing component cannot take down the others
+        (
+            session_stats,
+            broker_stats,
+            event_stats,
+            global_mesh_stats,
+            ai_stats,
+            security_stats,
+            analytics_stats,
+        ) = await asyncio.gather(
+            _component_stats(session_cluster, "get_session_stats", {"active_sessions": 0, "cluster_size": 1}),
+            # HybridMessageBroker has no get_message_stats today; the defaults are reported until it does
+            _component_stats(hybrid_broker, "get_message_stats", {"queue_size": 0, "processing_rate": 0}),
+            _component_stats(event_sourcing_manager, "get_event_stats", {"processed_events": 0, "processing_latency": 0}),
+            _component_stats(global_service_mesh, "get_global_mesh_analytics", {"active_nodes": 0, "requests_processed": 0}),
+            _component_stats(ultra_ai_manager, "get_ai_system_overview", {"model_accuracy": 0, "predictions_made": 0}),
+            _component_stats(ultra_security_manager, "get_comprehensive_security_report", {"threats_detected": 0, "authentications": 0}),
+            _component_stats(ultra_analytics_engine, "get_business_intelligence_dashboard", {"data_points_processed": 0, "insights_generated": 0}),
+        )
         
         # Get current timestamp for business metrics
-        current_time = int(time.time())
+        current_time = int(_wall_time())
         
         # Format metrics in Prometheus format
         metrics_data = [
@@ -891,9 +983,26 @@ async def metrics():
         ]
         
         # Combine registry metrics with custom metrics
-        return PlainTextResponse(registry_metrics_text + "\n" + "\n".join(metrics_data))
+        return registry_metrics + ("\n".join(metrics_data) + "\n").encode()
     except Exception as e:
-        return PlainTextResponse(f"# ERROR: {str(e)}")
+        return f"# ERROR: {str(e)}\n".encode()
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics endpoint"""
+    global _metrics_cache
+    rendered_at, payload = _metrics_cache
+    if time.monotonic() - rendered_at >= _METRICS_CACHE_TTL:
+        async with _metrics_lock:
+            # Another scrape may have rendered while we waited for the lock
+            rendered_at, payload = _metrics_cache
+            if time.monotonic() - rendered_at >= _METRICS_CACHE_TTL:
+                payload = await _render_metrics()
+                # A failed render is served once, not cached for the next scrapes
+                if not payload.startswith(b"# ERROR"):
+                    _metrics_cache = (time.monotonic(), payload)
+    return Response(content=payload, media_type=CONTENT_TYPE_LATEST)
 
 
 @app.get("/debug/db-metric")
@@ -905,30 +1014,34 @@ async def debug_db_metric():
     return {"ok": True, "rows": len(rows)}
 
 
+_DEMO_BODY = orjson.dumps({
+    "message": "Ultra-Advanced Redis ecosystem operational",
+    "revolutionary_features": {
+        "global_mesh": "Multi-region service mesh with geographic routing",
+        "ultra_ai": "AI-powered caching, security, and analytics decisions",
+        "military_security": "Zero-trust architecture with threat intelligence",
+        "realtime_gaming": "WebRTC + collaborative editing + multiplayer gaming",
+        "global_bi": "Business intelligence with predictive analytics",
+        "advanced_search": "Full-text search with vector similarity",
+        "ultra_monitoring": "Advanced monitoring with ML-powered insights"
+    },
+    "ultra_demo_endpoint": "/redis-advanced/demo/revolutionary_user",
+    "ai_powered_features": [
+        "Intelligent caching decisions",
+        "Predictive load balancing",
+        "Automated security responses",
+        "Business intelligence insights",
+        "Performance optimization",
+        "Anomaly detection"
+    ]
+})
+_DEMO_ETAG = _etag(_DEMO_BODY)
+
+
 @app.get("/demo")
-async def demo():
+async def demo(request: Request):
     """Ultra-advanced demo endpoint"""
-    return {
-        "message": "Ultra-Advanced Redis ecosystem operational",
-        "revolutionary_features": {
-            "global_mesh": "Multi-region service mesh with geographic routing",
-            "ultra_ai": "AI-powered caching, security, and analytics decisions",
-            "military_security": "Zero-trust architecture with threat intelligence",
-            "realtime_gaming": "WebRTC + collaborative editing + multiplayer gaming",
-            "global_bi": "Business intelligence with predictive analytics",
-            "advanced_search": "Full-text search with vector similarity",
-            "ultra_monitoring": "Advanced monitoring with ML-powered insights"
-        },
-        "ultra_demo_endpoint": "/redis-advanced/demo/revolutionary_user",
-        "ai_powered_features": [
-            "Intelligent caching decisions",
-            "Predictive load balancing",
-            "Automated security responses",
-            "Business intelligence insights",
-            "Performance optimization",
-            "Anomaly detection"
-        ]
-    }
+    return _static_json_response(request, _DEMO_BODY, _DEMO_ETAG)
 
 
 # Example of using ultra-advanced features
@@ -938,7 +1051,7 @@ async def ultra_feature_demo(request: Request, feature: str):
     if feature == "ai_cache":
         # AI-powered cache decision
         decision = await ultra_ai_manager.ai_powered_cache_decision(
-            "demo_key", 1024, 50, time.time() - 3600
+            "demo_key", 1024, 50, _wall_time() - 3600
         )
         return {"feature": "ai_cache", "decision": decision}
 
@@ -968,107 +1081,112 @@ async def ultra_feature_demo(request: Request, feature: str):
 
 @app.get("/dashboard/health")
 async def centralized_health_dashboard():
-    """Centralized health dashboard for all services"""
-    try:
-        # Get health information from various components
-        cache_stats = api_cache_manager.get_cache_stats()
-        session_stats = await session_cluster.get_session_stats()
-        rate_limit_stats = rate_limiter.get_rate_limit_stats()
-        postgres_stats = postgres_cache_manager.get_cache_stats()
-        mongodb_stats = mongodb_cache_manager.get_cache_stats()
-        broker_stats = await hybrid_broker.get_message_stats()
-        event_stats = await event_sourcing_manager.get_event_stats()
-        global_mesh_stats = await global_service_mesh.get_global_mesh_analytics()
-        ai_stats = await ultra_ai_manager.get_ai_system_overview()
-        security_stats = await ultra_security_manager.get_comprehensive_security_report()
-        analytics_stats = await ultra_analytics_engine.get_business_intelligence_dashboard()
-        
-        # Mock service health statuses (in a real implementation, these would be actual checks)
-        service_health = {
-            "fastapi": {
-                "status": "healthy",
-                "uptime": "24h",
-                "response_time": "45ms",
-                "errors_last_hour": 0
-            },
-            "nestjs": {
-                "status": "healthy",
-                "uptime": "24h",
-                "response_time": "32ms",
-                "errors_last_hour": 0
-            },
-            "redis": {
-                "status": "healthy",
-                "uptime": "24h",
-                "memory_usage": "45MB",
-                "connections": 12
-            },
-            "postgresql": {
-                "status": "healthy",
-                "uptime": "24h",
-                "connections": 8,
-                "disk_usage": "2.1GB"
-            },
-            "mongodb": {
-                "status": "healthy",
-                "uptime": "24h",
-                "connections": 5,
-                "disk_usage": "1.8GB"
-            },
-            "rabbitmq": {
-                "status": "healthy",
-                "uptime": "24h",
-                "queues": 3,
-                "messages": 42
-            },
-            "grafana": {
-                "status": "healthy",
-                "uptime": "24h",
-                "dashboards": 15
-            },
-            "prometheus": {
-                "status": "healthy",
-                "uptime": "24h",
-                "targets": 12
-            },
-            "loki": {
-                "status": "healthy",
-                "uptime": "24h",
-                "entries": "1.2M"
-            }
+    """Centralized health dashboard for all services.
+
+    Streamed as chunked JSON: the service summary is sent first and each Redis
+    ecosystem stat is written as soon as its backend answers, so the response
+    starts with the fastest component instead of waiting for the slowest.
+    """
+    # Mock service health statuses (in a real implementation, these would be actual checks)
+    service_health = {
+        "fastapi": {
+            "status": "healthy",
+            "uptime": "24h",
+            "response_time": "45ms",
+            "errors_last_hour": 0
+        },
+        "nestjs": {
+            "status": "healthy",
+            "uptime": "24h",
+            "response_time": "32ms",
+            "errors_last_hour": 0
+        },
+        "redis": {
+            "status": "healthy",
+            "uptime": "24h",
+            "memory_usage": "45MB",
+            "connections": 12
+        },
+        "postgresql": {
+            "status": "healthy",
+            "uptime": "24h",
+            "connections": 8,
+            "disk_usage": "2.1GB"
+        },
+        "mongodb": {
+            "status": "healthy",
+            "uptime": "24h",
+            "connections": 5,
+            "disk_usage": "1.8GB"
+        },
+        "rabbitmq": {
+            "status": "healthy",
+            "uptime": "24h",
+            "queues": 3,
+            "messages": 42
+        },
+        "grafana": {
+            "status": "healthy",
+            "uptime": "24h",
+            "dashboards": 15
+        },
+        "prometheus": {
+            "status": "healthy",
+            "uptime": "24h",
+            "targets": 12
+        },
+        "loki": {
+            "status": "healthy",
+            "uptime": "24h",
+            "entries": "1.2M"
         }
-        
-        # Calculate overall system health
-        healthy_services = sum(1 for service in service_health.values() if service["status"] == "healthy")
-        total_services = len(service_health)
-        overall_health = "healthy" if healthy_services == total_services else "degraded"
-        
-        return {
+    }
+
+    # Calculate overall system health
+    healthy_services = sum(1 for service in service_health.values() if service["status"] == "healthy")
+    total_services = len(service_health)
+    overall_health = "healthy" if healthy_services == total_services else "degraded"
+
+    # Health information from the Redis ecosystem components (sync or async getters)
+    stat_sources = {
+        "cache_stats": lambda: api_cache_manager.get_cache_stats(),
+        "session_cluster": lambda: session_cluster.get_session_stats(),
+        "rate_limiting": lambda: rate_limiter.get_rate_limit_stats(),
+        "postgres_cache": lambda: postgres_cache_manager.get_cache_stats(),
+        "mongodb_cache": lambda: mongodb_cache_manager.get_cache_stats(),
+        "message_broker": lambda: hybrid_broker.get_message_stats(),
+        "event_sourcing": lambda: event_sourcing_manager.get_event_stats(),
+        "global_service_mesh": lambda: global_service_mesh.get_global_mesh_analytics(),
+        "ai_system": lambda: ultra_ai_manager.get_ai_system_overview(),
+        "security_system": lambda: ultra_security_manager.get_comprehensive_security_report(),
+        "analytics_engine": lambda: ultra_analytics_engine.get_business_intelligence_dashboard(),
+    }
+
+    async def _fetch_stat(name, fetch):
+        try:
+            data = fetch()
+            if inspect.isawaitable(data):
+                data = await data
+        except Exception as e:
+            data = {"status": "unhealthy", "error": str(e)}
+        return name, data
+
+    async def body():
+        summary = orjson.dumps({
             "overall_status": overall_health,
             "healthy_services": healthy_services,
             "total_services": total_services,
             "services": service_health,
-            "redis_ecosystem": {
-                "cache_stats": cache_stats,
-                "session_cluster": session_stats,
-                "rate_limiting": rate_limit_stats,
-                "postgres_cache": postgres_stats,
-                "mongodb_cache": mongodb_stats,
-                "message_broker": broker_stats,
-                "event_sourcing": event_stats,
-                "global_service_mesh": global_mesh_stats,
-                "ai_system": ai_stats,
-                "security_system": security_stats,
-                "analytics_engine": analytics_stats
-            },
-            "timestamp": time.time()
-        }
-    except Exception as e:
-        return {
-            "overall_status": "unhealthy",
-            "error": str(e),
-            "timestamp": time.time()
-        }
+        })
+        yield summary[:-1] + b',"redis_ecosystem":{'
+        first = True
+        for next_stat in asyncio.as_completed([_fetch_stat(n, f) for n, f in stat_sources.items()]):
+            name, data = await next_stat
+            yield (b"" if first else b",") + orjson.dumps(name) + b":" + orjson.dumps(data, default=str)
+            first = False
+        yield b'},"timestamp":' + orjson.dumps(_wall_time()) + b"}"
+
+    return StreamingResponse(body(), media_type="application/json")
 
 
 @app.post("/test/message")
@@ -1180,7 +1298,7 @@ FAKE_USERS = [
 @usuarios_router.get("/", response_model=List[UsuarioOut])
 async def listar_usuarios():
     # Fallback sem banco para desenvolvimento
-    if os.getenv("FASTAPI_SKIP_DB", "0") in ("1", "true", "True"):
+    if _SKIP_DB:
         return FAKE_USERS
     pool = await get_pool()
     rows = await instrumented_fetch('SELECT idusuario AS "IdUsuario", nome AS "Nome", NULL::text AS "Funcao", NULL::text AS "Departamento", NULL::text AS "Lotacao", perfil AS "Perfil", permissao AS "Permissao", email AS "Email", usuario AS "Login", senha AS "Senha", datacadastro AS "DataCadastro", cadastrante AS "Cadastrante", imagem AS "Image", dataupdate AS "DataUpdate", NULL::text AS "TipoUpdate", NULL::text AS "Observacao" FROM "SEC"."Usuario" ORDER BY idusuario ASC', pool=pool)
@@ -1189,7 +1307,7 @@ async def listar_usuarios():
 @usuarios_router.get("/{id}", response_model=UsuarioOut)
 async def obter_usuario(id: int):
     # Fallback sem banco
-    if os.getenv("FASTAPI_SKIP_DB", "0") in ("1", "true", "True"):
+    if _SKIP_DB:
         for u in FAKE_USERS:
             if u["IdUsuario"] == id:
                 return u
@@ -1200,7 +1318,6 @@ async def obter_usuario(id: int):
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
     return row_to_dict(row)
 
-from pydantic import BaseModel
 class UsuarioCreate(BaseModel):
     Nome: str
     Funcao: Optional[str] = None
@@ -1234,7 +1351,7 @@ class UsuarioUpdate(BaseModel):
 @usuarios_router.post("/", response_model=UsuarioOut)
 async def criar_usuario(payload: UsuarioCreate):
     # Fallback sem banco
-    if os.getenv("FASTAPI_SKIP_DB", "0") in ("1", "true", "True"):
+    if _SKIP_DB:
         new_id = (max([u["IdUsuario"] for u in FAKE_USERS]) + 1) if FAKE_USERS else 1
         rec = {
             "IdUsuario": new_id,
@@ -1274,7 +1391,7 @@ async def criar_usuario(payload: UsuarioCreate):
 @usuarios_router.put("/{id}", response_model=UsuarioOut)
 async def atualizar_usuario(id: int, payload: UsuarioUpdate):
     # Fallback sem banco
-    if os.getenv("FASTAPI_SKIP_DB", "0") in ("1", "true", "True"):
+    if _SKIP_DB:
         data = payload.dict(exclude_unset=True)
         for u in FAKE_USERS:
             if u["IdUsuario"] == id:
@@ -1327,7 +1444,7 @@ async def atualizar_usuario(id: int, payload: UsuarioUpdate):
 @usuarios_router.delete("/{id}", response_model=OperationResult)
 async def remover_usuario(id: int):
     # Fallback sem banco
-    if os.getenv("FASTAPI_SKIP_DB", "0") in ("1", "true", "True"):
+    if _SKIP_DB:
         for i, u in enumerate(FAKE_USERS):
             if u["IdUsuario"] == id:
                 FAKE_USERS.pop(i)
@@ -1342,23 +1459,22 @@ async def remover_usuario(id: int):
     return {"ok": True}
 
 # Endpoint seguro para alteração de senha (gera hash $2b$)
-from pydantic import BaseModel
 class PasswordChange(BaseModel):
     new_password: str
     requested_by: Optional[str] = None
 
 @usuarios_router.post("/{id}/password", response_model=OperationResult)
-async def alterar_senha_usuario(id: int, payload: PasswordChange):
+async def alterar_senha_usuario(id: int, payload: PasswordChange, request: Request):
     # Rejeitar senhas acima de 72 bytes (limite do bcrypt)
     if len(payload.new_password.encode("utf-8")) > 72:
         raise HTTPException(status_code=400, detail="Senha muito longa (limite: 72 bytes)")
 
     import bcrypt
     salt = bcrypt.gensalt(rounds=11)
-    hashed = bcrypt.hashpw(payload.new_password.encode("utf-8"), salt).decode("utf-8")  # $2b$
+    hashed = (await run_blocking(request, bcrypt.hashpw, payload.new_password.encode("utf-8"), salt)).decode("utf-8")  # $2b$
 
     # Fallback sem banco
-    if os.getenv("FASTAPI_SKIP_DB", "0") in ("1", "true", "True"):
+    if _SKIP_DB:
         for u in FAKE_USERS:
             if u["IdUsuario"] == id:
                 u["Senha"] = hashed
@@ -2,24 +2,65 @@
 Advanced Monitoring and Observability Module
 Complete monitoring stack with Prometheus, Jaeger, and custom metrics
 """
+import os
 import time
 import asyncio
-from typing import Dict, List, Any, Optional
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Iterable
+import orjson
 import structlog
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-import json
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 # Prometheus metrics
 from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry, generate_latest
-import prometheus_client as prom
 
 # Jaeger tracing
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
-from opentelemetry.exporter.jaeger.thrift import JaegerExporter
 from opentelemetry.sdk.resources import Resource
+# Prefer OTLP (batched at the protocol level); the Jaeger Thrift exporter is deprecated
+try:
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+except Exception:
+    OTLPSpanExporter = None
+try:
+    from opentelemetry.exporter.jaeger.thrift import JaegerExporter
+except Exception:
+    JaegerExporter = None
+
+
+def configure_logging():
+    """Render structlog output for the whole process as JSON bytes via orjson.
+
+    Called by the app at startup, not at import, so importing this module does
+    not change logging for other structlog users. orjson encodes datetime values
+    natively (naive values are treated as UTC). Non-str keys and non-JSON values
+    are stringified, as the stdlib json renderer tolerated, so a logging call
+    never raises.
+    """
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(
+                serializer=orjson.dumps,
+                option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+                default=str
+            ),
+        ],
+        logger_factory=structlog.BytesLoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
 
 # Initialize logger
 logger = structlog.get_logger()
@@ -27,6 +68,57 @@ logger = structlog.get_logger()
 # Custom Prometheus registry
 monitoring_registry = CollectorRegistry()
 
+# System metrics are never sampled more often than this, however often the collector wakes
+SYSTEM_METRICS_MIN_INTERVAL_S = 5
+
+# Dashboard metric values are read from the registry at most this often
+DASHBOARD_METRICS_TTL_S = 5
+
+# Security log severity by action
+_HIGH_SEVERITY_ACTIONS = frozenset({
+    'unauthorized_access',
+    'suspicious_activity',
+    'data_breach',
+    'privilege_escalation'
+})
+_MEDIUM_SEVERITY_ACTIONS = frozenset({
+    'login',
+    'logout',
+    'password_change',
+    'token_refresh'
+})
+
+async def _sleep_until_next(deadline: float, interval: float) -> float:
+    """Sleep until the next tick of a fixed monotonic schedule and return it.
+
+    Ticks land on deadline + k * interval, so the time spent sampling does not
+    accumulate as drift; ticks missed by a stalled loop are skipped, not replayed.
+    """
+    now = time.monotonic()
+    deadline += interval
+    if deadline <= now:
+        deadline += ((now - deadline) // interval + 1) * interval
+    await asyncio.sleep(deadline - now)
+    return deadline
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp
+_timestamp_prefix = (0, "")
+
+def _utc_timestamp() -> str:
+    """Current UTC time in ISO 8601; the date/time prefix is formatted once per second"""
+    global _timestamp_prefix
+    now = time.time()
+    second = int(now)
+    if _timestamp_prefix[0] != second:
+        _timestamp_prefix = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+    return f"{_timestamp_prefix[1]}.{int((now - second) * 1_000_000):06d}+00:00"
+
+async def _cancel_tasks(tasks: List[asyncio.Task]):
+    """Cancel background tasks and wait for them to finish"""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
 @dataclass
 class BusinessMetrics:
     """Business-specific metrics for monitoring"""
@@ -40,98 +132,138 @@ class BusinessMetrics:
     memory_usage: Gauge
     cpu_usage: Gauge
 
+def _build_metrics() -> BusinessMetrics:
+    """Register the business metrics on the monitoring registry (no I/O, no tasks)"""
+    return BusinessMetrics(
+        api_requests_total=Counter(
+            'api_requests_total',
+            'Total number of API requests',
+            ['endpoint', 'method', 'status_code'],
+            registry=monitoring_registry
+        ),
+        api_response_time=Histogram(
+            'api_response_time_seconds',
+            'API response time in seconds',
+            ['endpoint', 'method'],
+            # Every bucket is a series per endpoint/method; +Inf is implicit.
+            # 2.0 is the HighResponseTime threshold in Docker/prometheus/rules/sec-alerts.yml
+            buckets=[0.1, 0.5, 1.0, 2.0, 5.0],
+            registry=monitoring_registry
+        ),
+        active_users=Gauge(
+            'active_users',
+            'Number of currently active users',
+            registry=monitoring_registry
+        ),
+        business_transactions=Counter(
+            'business_transactions_total',
+            'Total number of business transactions',
+            ['transaction_type', 'status'],
+            registry=monitoring_registry
+        ),
+        error_rate=Counter(
+            'error_rate_total',
+            'Total number of errors',
+            ['error_type', 'endpoint'],
+            registry=monitoring_registry
+        ),
+        cache_hit_rate=Gauge(
+            'cache_hit_rate',
+            'Cache hit rate percentage',
+            registry=monitoring_registry
+        ),
+        database_query_time=Histogram(
+            'database_query_time_seconds',
+            'Database query execution time',
+            # Table names stay in logs/traces; as a label they multiply every bucket
+            ['query_type'],
+            buckets=[0.01, 0.1, 0.5, 1.0],
+            registry=monitoring_registry
+        ),
+        memory_usage=Gauge(
+            'memory_usage_bytes',
+            'Memory usage in bytes of this FastAPI process',
+            registry=monitoring_registry
+        ),
+        cpu_usage=Gauge(
+            'cpu_usage_percent',
+            'CPU usage percentage of this FastAPI process',
+            registry=monitoring_registry
+        )
+    )
+
 class MetricsCollector:
     """Advanced metrics collection for business intelligence"""
 
     def __init__(self):
-        self.business_metrics = BusinessMetrics(
-            api_requests_total=Counter(
-                'api_requests_total',
-                'Total number of API requests',
-                ['endpoint', 'method', 'status_code'],
-                registry=monitoring_registry
-            ),
-            api_response_time=Histogram(
-                'api_response_time_seconds',
-                'API response time in seconds',
-                ['endpoint', 'method'],
-                buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0],
-                registry=monitoring_registry
-            ),
-            active_users=Gauge(
-                'active_users',
-                'Number of currently active users',
-                registry=monitoring_registry
-            ),
-            business_transactions=Counter(
-                'business_transactions_total',
-                'Total number of business transactions',
-                ['transaction_type', 'status'],
-                registry=monitoring_registry
-            ),
-            error_rate=Counter(
-                'error_rate_total',
-                'Total number of errors',
-                ['error_type', 'endpoint'],
-                registry=monitoring_registry
-            ),
-            cache_hit_rate=Gauge(
-                'cache_hit_rate',
-                'Cache hit rate percentage',
-                registry=monitoring_registry
-            ),
-            database_query_time=Histogram(
-                'database_query_time_seconds',
-                'Database query execution time',
-                ['query_type', 'table'],
-                buckets=[0.01, 0.1, 0.5, 1.0, 2.0, 5.0],
-                registry=monitoring_registry
-            ),
-            memory_usage=Gauge(
-                'memory_usage_bytes',
-                'Memory usage in bytes',
-                ['component'],
-                registry=monitoring_registry
-            ),
-            cpu_usage=Gauge(
-                'cpu_usage_percent',
-                'CPU usage percentage',
-                ['component'],
-                registry=monitoring_registry
-            )
-        )
+        self.business_metrics = _build_metrics()
+
+        # Pre-labelled children, keyed by label values, so the hot path skips
+        # prometheus_client's per-call label validation and lookup
+        self._request_counters: Dict[tuple, Any] = {}
+        self._response_timers: Dict[tuple, Any] = {}
+        self._error_counters: Dict[tuple, Any] = {}
+        self._transaction_counters: Dict[tuple, Any] = {}
+        self._query_timers: Dict[str, Any] = {}
+        # Route templates registered on the app; anything else is bucketed as "other"
+        self._allowed_routes: set = set()
+
+        # Process handle is created once; cpu_percent(None) primes the baseline so
+        # later samples are measured against the previous call
+        self._process = psutil.Process() if psutil is not None else None
+        if self._process is not None:
+            self._process.cpu_percent(interval=None)
+        self._last_sample_ts = 0.0
 
         self.start_time = time.time()
-        self._start_background_tasks()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """Start background metrics collection on the running loop"""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._collect_system_metrics()),
+            asyncio.create_task(self._collect_business_metrics())
+        ]
 
-    def _start_background_tasks(self):
-        """Start background tasks for metrics collection"""
-        asyncio.create_task(self._collect_system_metrics())
-        asyncio.create_task(self._collect_business_metrics())
+    async def stop(self):
+        """Cancel background metrics collection"""
+        await _cancel_tasks(self._tasks)
+        self._tasks = []
 
     async def _collect_system_metrics(self):
         """Collect system-level metrics periodically"""
+        if self._process is None:
+            logger.warning("psutil not installed; system metrics disabled")
+            return
+
+        loop = asyncio.get_running_loop()
+        next_deadline = time.monotonic()
         while True:
             try:
-                # Memory usage
-                import psutil
-                process = psutil.Process()
-                memory_info = process.memory_info()
-
-                self.business_metrics.memory_usage.labels(component="fastapi").set(memory_info.rss)
-                self.business_metrics.cpu_usage.labels(component="fastapi").set(process.cpu_percent())
-
-                # Database connections (mock for now)
-                self.business_metrics.memory_usage.labels(component="postgresql").set(memory_info.rss * 0.3)
-                self.business_metrics.memory_usage.labels(component="redis").set(memory_info.rss * 0.2)
+                now = time.monotonic()
+                if now - self._last_sample_ts >= SYSTEM_METRICS_MIN_INTERVAL_S:
+                    self._last_sample_ts = now
+                    # /proc reads can block, so they run off the event loop
+                    rss, cpu = await loop.run_in_executor(None, self._sample_process)
+                    self.business_metrics.memory_usage.set(rss)
+                    self.business_metrics.cpu_usage.set(cpu)
 
             except Exception as e:
                 logger.error("System metrics collection failed", error=str(e))
 
-            await asyncio.sleep(30)  # Collect every 30 seconds
+            next_deadline = await _sleep_until_next(next_deadline, 30)  # Collect every 30 seconds
+
+    def _sample_process(self) -> tuple:
+        """Read RSS and CPU percent of this process"""
+        # oneshot() reads /proc/<pid>/stat once for both values
+        with self._process.oneshot():
+            return self._process.memory_info().rss, self._process.cpu_percent(interval=None)
 
     async def _collect_business_metrics(self):
         """Collect business-specific metrics"""
+        next_deadline = time.monotonic()
         while True:
             try:
                 # Update active users (mock data)
@@ -143,34 +275,69 @@ class MetricsCollector:
             except Exception as e:
                 logger.error("Business metrics collection failed", error=str(e))
 
-            await asyncio.sleep(60)  # Collect every minute
+            next_deadline = await _sleep_until_next(next_deadline, 60)  # Collect every minute
+
+    def register_routes(self, routes):
+        """Record the app's route templates as the allowed endpoint label values
+
+        Histogram children are still created lazily on first request: pre-creating
+        them would export zero-valued bucket series for routes nobody calls.
+        """
+        for route in routes:
+            path = getattr(route, "path", None)
+            if path:
+                self._allowed_routes.add(path)
+
+    def _bounded_endpoint(self, endpoint: str) -> str:
+        """Keep the endpoint label bounded to known route templates"""
+        if self._allowed_routes and endpoint not in self._allowed_routes:
+            return "other"
+        return endpoint
 
     def record_api_request(self, endpoint: str, method: str, status_code: int, response_time: float):
         """Record API request metrics"""
-        self.business_metrics.api_requests_total.labels(
-            endpoint=endpoint,
-            method=method,
-            status_code=str(status_code)
-        ).inc()
+        endpoint = self._bounded_endpoint(endpoint)
+        # Status class (2xx/4xx/...) instead of the exact code keeps series count bounded
+        status_class = f"{int(status_code) // 100}xx"
+
+        counter_key = (endpoint, method, status_class)
+        counter = self._request_counters.get(counter_key)
+        if counter is None:
+            counter = self._request_counters[counter_key] = self.business_metrics.api_requests_total.labels(
+                endpoint=endpoint,
+                method=method,
+                status_code=status_class
+            )
+        counter.inc()
 
-        self.business_metrics.api_response_time.labels(
-            endpoint=endpoint,
-            method=method
-        ).observe(response_time)
+        timer = self._response_timers.get((endpoint, method))
+        if timer is None:
+            timer = self._response_timers[(endpoint, method)] = self.business_metrics.api_response_time.labels(
+                endpoint=endpoint,
+                method=method
+            )
+        timer.observe(response_time)
 
     def record_business_transaction(self, transaction_type: str, status: str):
         """Record business transaction metrics"""
-        self.business_metrics.business_transactions.labels(
-            transaction_type=transaction_type,
-            status=status
-        ).inc()
+        counter = self._transaction_counters.get((transaction_type, status))
+        if counter is None:
+            counter = self._transaction_counters[(transaction_type, status)] = self.business_metrics.business_transactions.labels(
+                transaction_type=transaction_type,
+                status=status
+            )
+        counter.inc()
 
     def record_error(self, error_type: str, endpoint: str):
         """Record error metrics"""
-        self.business_metrics.error_rate.labels(
-            error_type=error_type,
-            endpoint=endpoint
-        ).inc()
+        endpoint = self._bounded_endpoint(endpoint)
+        counter = self._error_counters.get((error_type, endpoint))
+        if counter is None:
+            counter = self._error_counters[(error_type, endpoint)] = self.business_metrics.error_rate.labels(
+                error_type=error_type,
+                endpoint=endpoint
+            )
+        counter.inc()
 
     def record_database_query(self, query_type: str, table: str, execution_time: float):
         """Record database query metrics"""
@@ -180,14 +347,25 @@ class MetricsCollector:
         except Exception:
             # Evitar que falha de log impeça registro da métrica
             pass
-        self.business_metrics.database_query_time.labels(
-            query_type=query_type,
-            table=table
-        ).observe(execution_time)
+        timer = self._query_timers.get(query_type)
+        if timer is None:
+            timer = self._query_timers[query_type] = self.business_metrics.database_query_time.labels(
+                query_type=query_type
+            )
+        timer.observe(execution_time)
+
+    @contextmanager
+    def time_database_query(self, query_type: str, table: str):
+        """Time the enclosed block and record it as a database query"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_database_query(query_type, table, time.perf_counter() - start)
 
-    def get_all_metrics(self) -> str:
-        """Get all metrics in Prometheus format"""
-        return generate_latest(monitoring_registry).decode('utf-8')
+    def get_all_metrics(self) -> bytes:
+        """Get all metrics in Prometheus format (UTF-8 encoded)"""
+        return generate_latest(monitoring_registry)
 
 # Initialize metrics collector
 metrics_collector = MetricsCollector()
@@ -210,21 +388,38 @@ class JaegerTracerManager:
         # Set up tracer provider
         trace.set_tracer_provider(TracerProvider(resource=resource))
 
-        # Jaeger exporter
-        jaeger_exporter = JaegerExporter(
-            agent_host_name="jaeger",
-            agent_port=6831,
-        )
-
-        # Add span processor
-        span_processor = BatchSpanProcessor(jaeger_exporter)
-        trace.get_tracer_provider().add_span_processor(span_processor)
+        # OTLP exporter, falling back to the Jaeger agent
+        if OTLPSpanExporter is not None:
+            span_exporter = OTLPSpanExporter()
+        elif JaegerExporter is not None:
+            span_exporter = JaegerExporter(
+                agent_host_name="jaeger",
+                agent_port=6831,
+                # A 256-span batch can exceed one UDP datagram; split instead of dropping it
+                udp_split_oversized_batches=True,
+                # Bound per-span payload so large attributes don't bloat every packet
+                max_tag_value_length=1024,
+            )
+        else:
+            span_exporter = None
+
+        # Add span processor sized for request bursts
+        if span_exporter is not None:
+            span_processor = BatchSpanProcessor(
+                span_exporter,
+                max_queue_size=4096,
+                schedule_delay_millis=1000,
+                max_export_batch_size=256,
+                export_timeout_millis=10000
+            )
+            trace.get_tracer_provider().add_span_processor(span_processor)
 
-        # Console exporter for debugging
-        console_exporter = ConsoleSpanExporter()
-        trace.get_tracer_provider().add_span_processor(
-            BatchSpanProcessor(console_exporter)
-        )
+        # Console exporter for debugging only (serializes every span to stdout)
+        if os.getenv("OTEL_DEBUG") == "1":
+            console_exporter = ConsoleSpanExporter()
+            trace.get_tracer_provider().add_span_processor(
+                BatchSpanProcessor(console_exporter)
+            )
 
     def start_span(self, name: str, context: Optional[Dict[str, Any]] = None) -> trace.Span:
         """Start a new tracing span"""
@@ -249,57 +444,68 @@ class LogAggregationManager:
     """Advanced log aggregation for structured logging and analysis"""
 
     def __init__(self):
-        self.log_buffer = []
         self.max_buffer_size = 1000
-        self._start_log_processing()
-
-    def _start_log_processing(self):
-        """Start background log processing"""
-        asyncio.create_task(self._process_log_buffer())
+        # Bounded: when producers outrun the flusher the oldest entries are dropped
+        self.log_buffer = deque(maxlen=self.max_buffer_size)
+        # Set when the buffer fills so the flusher runs early instead of spawning tasks
+        self._flush_requested = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """Start background log processing on the running loop"""
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._process_log_buffer())]
+
+    async def stop(self):
+        """Cancel background log processing"""
+        await _cancel_tasks(self._tasks)
+        self._tasks = []
 
     async def _process_log_buffer(self):
         """Process log buffer periodically"""
         while True:
+            try:
+                # Process every 10 seconds, or as soon as the buffer fills
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+
             try:
                 if self.log_buffer:
-                    # Process logs for aggregation
-                    await self._aggregate_logs(self.log_buffer.copy())
-                    self.log_buffer.clear()
+                    # Swap in a fresh buffer (O(1)) so entries added meanwhile are kept
+                    logs, self.log_buffer = self.log_buffer, deque(maxlen=self.max_buffer_size)
+                    await self._aggregate_logs(logs)
 
             except Exception as e:
                 logger.error("Log processing failed", error=str(e))
 
-            await asyncio.sleep(10)  # Process every 10 seconds
-
-    async def _aggregate_logs(self, logs: List[Dict[str, Any]]):
+    async def _aggregate_logs(self, logs: Iterable[Dict[str, Any]]):
         """Aggregate logs for analysis"""
         # Group logs by type and level
-        aggregated = {}
+        aggregated = defaultdict(lambda: defaultdict(list))
+        total_logs = 0
 
         for log in logs:
-            log_type = log.get('logger', 'unknown')
-            level = log.get('level', 'info')
-
-            if log_type not in aggregated:
-                aggregated[log_type] = {}
-
-            if level not in aggregated[log_type]:
-                aggregated[log_type][level] = []
+            aggregated[log.get('logger', 'unknown')][log.get('level', 'info')].append(log)
+            total_logs += 1
 
-            aggregated[log_type][level].append(log)
-
-        # Log aggregation summary
+        # Log aggregation summary: per type/level counts, not the buffered entries themselves
         logger.info(
             "Log aggregation completed",
-            total_logs=len(logs),
+            total_logs=total_logs,
             log_types=len(aggregated),
-            aggregated_summary=aggregated
+            aggregated_summary={
+                log_type: {level: len(entries) for level, entries in levels.items()}
+                for log_type, levels in aggregated.items()
+            }
         )
 
     def add_structured_log(self, log_entry: Dict[str, Any]):
         """Add structured log entry to buffer"""
         log_entry.update({
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _utc_timestamp(),
             'service': 'sec-fastapi',
             'version': '4.0.0'
         })
@@ -307,8 +513,8 @@ class LogAggregationManager:
         self.log_buffer.append(log_entry)
 
         if len(self.log_buffer) >= self.max_buffer_size:
-            # Process immediately if buffer is full
-            asyncio.create_task(self._process_log_buffer())
+            # Wake the flusher if buffer is full
+            self._flush_requested.set()
 
     def create_security_log(self, action: str, user_id: str, resource: str, details: Dict[str, Any]):
         """Create security-specific structured log"""
@@ -334,23 +540,9 @@ class LogAggregationManager:
 
     def _determine_severity(self, action: str) -> str:
         """Determine log severity based on action"""
-        high_severity_actions = [
-            'unauthorized_access',
-            'suspicious_activity',
-            'data_breach',
-            'privilege_escalation'
-        ]
-
-        medium_severity_actions = [
-            'login',
-            'logout',
-            'password_change',
-            'token_refresh'
-        ]
-
-        if action in high_severity_actions:
+        if action in _HIGH_SEVERITY_ACTIONS:
             return 'HIGH'
-        elif action in medium_severity_actions:
+        elif action in _MEDIUM_SEVERITY_ACTIONS:
             return 'MEDIUM'
         else:
             return 'LOW'
@@ -360,6 +552,10 @@ class DashboardManager:
 
     def __init__(self):
         self.dashboards = {}
+        # dashboard name -> metric names, computed once per definition
+        self._metric_sets: Dict[str, frozenset] = {}
+        # metric name -> (monotonic timestamp, value)
+        self._metric_cache: Dict[str, tuple] = {}
         self._initialize_default_dashboards()
 
     def _initialize_default_dashboards(self):
@@ -367,41 +563,45 @@ class DashboardManager:
         self.dashboards = {
             'api_performance': {
                 'title': 'API Performance Dashboard',
-                'metrics': [
+                'metrics': (
                     'api_requests_total',
                     'api_response_time_seconds',
                     'error_rate_total',
                     'cache_hit_rate'
-                ],
+                ),
                 'refresh_interval': 30
             },
             'database_health': {
                 'title': 'Database Health Dashboard',
-                'metrics': [
+                'metrics': (
                     'database_query_time_seconds',
                     'memory_usage_bytes',
                     'cpu_usage_percent'
-                ],
+                ),
                 'refresh_interval': 60
             },
             'business_metrics': {
                 'title': 'Business Metrics Dashboard',
-                'metrics': [
+                'metrics': (
                     'active_users',
                     'business_transactions_total',
                     'cache_hit_rate'
-                ],
+                ),
                 'refresh_interval': 120
             },
             'security_monitoring': {
                 'title': 'Security Monitoring Dashboard',
-                'metrics': [
+                'metrics': (
                     'error_rate_total',
                     'api_requests_total'
-                ],
+                ),
                 'refresh_interval': 30
             }
         }
+        self._metric_sets = {
+            name: frozenset(dashboard['metrics'])
+            for name, dashboard in self.dashboards.items()
+        }
 
     def get_dashboard_data(self, dashboard_name: str) -> Dict[str, Any]:
         """Get dashboard data and metrics"""
@@ -411,44 +611,74 @@ class DashboardManager:
         dashboard = self.dashboards[dashboard_name]
 
         # Get current metrics for dashboard
-        metrics_data = {}
-        for metric_name in dashboard['metrics']:
-            # This would integrate with actual Prometheus metrics
-            metrics_data[metric_name] = self._get_metric_value(metric_name)
+        metrics_data = self._get_metric_values(self._metric_sets[dashboard_name])
 
         return {
             'dashboard': dashboard,
             'metrics': metrics_data,
-            'last_updated': datetime.utcnow().isoformat(),
+            'last_updated': _utc_timestamp(),
             'status': 'healthy'
         }
 
-    def _get_metric_value(self, metric_name: str) -> Any:
-        """Get current value for a metric (mock implementation)"""
-        # This would integrate with actual Prometheus registry
-        mock_values = {
-            'api_requests_total': 15420,
-            'api_response_time_seconds': 0.234,
-            'error_rate_total': 45,
-            'cache_hit_rate': 87.3,
-            'active_users': 156,
-            'business_transactions_total': 8934,
-            'database_query_time_seconds': 0.045,
-            'memory_usage_bytes': 134217728,  # 128MB
-            'cpu_usage_percent': 23.4
-        }
-
-        return mock_values.get(metric_name, 0)
+    def _get_metric_values(self, metric_names: frozenset) -> Dict[str, Any]:
+        """Get current values for metrics, refreshing stale ones in one registry pass"""
+        now = time.monotonic()
+        values = {}
+        stale = set()
+        for metric_name in metric_names:
+            cached = self._metric_cache.get(metric_name)
+            if cached is not None and now - cached[0] < DASHBOARD_METRICS_TTL_S:
+                values[metric_name] = cached[1]
+            else:
+                stale.add(metric_name)
+
+        if stale:
+            fresh = self._collect_metric_values(stale)
+            for metric_name in stale:
+                value = fresh.get(metric_name, 0)
+                self._metric_cache[metric_name] = (now, value)
+                values[metric_name] = value
+
+        return values
+
+    def _collect_metric_values(self, metric_names: set) -> Dict[str, Any]:
+        """Read metric values from the monitoring registry in a single collect() pass
+
+        Counters and gauges are summed across labels; histograms report their mean.
+        """
+        totals: Dict[str, float] = {}
+        histograms: Dict[str, List[float]] = {}
+
+        for family in monitoring_registry.collect():
+            if family.type == 'histogram':
+                if family.name not in metric_names:
+                    continue
+                sums = histograms.setdefault(family.name, [0.0, 0.0])
+                for sample in family.samples:
+                    if sample.name.endswith('_sum'):
+                        sums[0] += sample.value
+                    elif sample.name.endswith('_count'):
+                        sums[1] += sample.value
+            else:
+                for sample in family.samples:
+                    if sample.name in metric_names:
+                        totals[sample.name] = totals.get(sample.name, 0) + sample.value
+
+        for metric_name, (total, count) in histograms.items():
+            totals[metric_name] = total / count if count else 0
+
+        return totals
 
     def create_custom_dashboard(self, name: str, title: str, metrics: List[str], refresh_interval: int = 60):
         """Create a custom monitoring dashboard"""
         self.dashboards[name] = {
             'title': title,
-            'metrics': metrics,
+            'metrics': tuple(metrics),
             'refresh_interval': refresh_interval,
-            'created_at': datetime.utcnow().isoformat(),
+            'created_at': _utc_timestamp(),
             'type': 'custom'
         }
+        self._metric_sets[name] = frozenset(metrics)
 
         logger.info(
             "Custom dashboard created",
@@ -479,6 +709,6 @@ def get_dashboard(dashboard_name: str) -> Dict[str, Any]:
     """Get dashboard data"""
     return dashboard_manager.get_dashboard_data(dashboard_name)
 
-def get_all_metrics() -> str:
+def get_all_metrics() -> bytes:
     """Get all Prometheus metrics"""
     return metrics_collector.get_all_metrics()
@@ -5,111 +5,87 @@ Integrates with the new organized Backend services
 
 from fastapi import APIRouter
 
-# Create real FastAPI routers with the correct prefix and tags
+# One router for the /redis-advanced prefix; advanced_demo_router is kept as an alias
 redis_router = APIRouter(prefix="/redis-advanced", tags=["redis-advanced"])
-advanced_demo_router = APIRouter(prefix="/redis-advanced", tags=["redis-advanced"])
+advanced_demo_router = redis_router
 
 # Import actual implementations from the organized Backend structure
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+import importlib
 
 # Import actual Redis client and related services
 try:
-    from Backend.Redis.client import get_redis_client, test_redis_connection
+    from Backend.Redis.client import get_redis_client, test_redis_connection, close_redis_connection
 except ImportError:
     # Fallback to local Redis client if Backend module is not available
-    from .local_redis_client import get_redis_client, test_redis_connection
+    from .local_redis_client import get_redis_client, test_redis_connection, close_redis_connection
 
-# Import service mesh and registry
-try:
-    from Backend.Service_Mesh.service_mesh import service_mesh
-    from Backend.Service_Registry.service_registry import service_registry
-    from Backend.Service_Registration.service_registration import service_registration
-except ImportError:
-    # Create mock objects if Backend modules are not available
-    service_mesh = None
-    service_registry = None
-    service_registration = None
+# Backend service singletons are imported on first access (PEP 562): each one
+# pulls in its own clients, and most request paths never touch them.
+# A module that cannot be imported resolves to None, as before.
+_LAZY_SERVICES = {
+    # Service mesh and registry
+    "service_mesh": "Backend.Service_Mesh.service_mesh",
+    "service_registry": "Backend.Service_Registry.service_registry",
+    "service_registration": "Backend.Service_Registration.service_registration",
 
-# Import message broker
-try:
-    from Backend.Message_Broker.message_broker import hybrid_broker
-    from Backend.Message_Broker.message_handler import message_handler
-    from Backend.Message_Broker.message_producer import message_producer
-except ImportError:
-    # Create mock objects if Backend modules are not available
-    hybrid_broker = None
-    message_handler = None
-    message_producer = None
+    # Message broker
+    "hybrid_broker": "Backend.Message_Broker.message_broker",
+    "message_handler": "Backend.Message_Broker.message_handler",
+    "message_producer": "Backend.Message_Broker.message_producer",
 
-# Import security services
-try:
-    from Backend.Security.security_service import ultra_security_service
-    from Backend.Security.oauth2.oauth2_provider import oauth2_provider
-    from Backend.Security.biometric.biometric_auth import biometric_auth
-    from Backend.Security.encryption.data_encryption import data_encryption
-except ImportError:
-    # Create mock objects if Backend modules are not available
-    ultra_security_service = None
-    oauth2_provider = None
-    biometric_auth = None
-    data_encryption = None
+    # Security services
+    "ultra_security_service": "Backend.Security.security_service",
+    "oauth2_provider": "Backend.Security.oauth2.oauth2_provider",
+    "biometric_auth": "Backend.Security.biometric.biometric_auth",
+    "data_encryption": "Backend.Security.encryption.data_encryption",
 
-# Import AI services
-try:
-    from Backend.AI.nlp.advanced_nlp import advanced_nlp_service
-    from Backend.AI.multimedia.content_generation import multimedia_content_service
-    from Backend.AI.analysis.sentiment_behavior import sentiment_behavior_service
-except ImportError:
-    # Create mock objects if Backend modules are not available
-    advanced_nlp_service = None
-    multimedia_content_service = None
-    sentiment_behavior_service = None
+    # AI services
+    "advanced_nlp_service": "Backend.AI.nlp.advanced_nlp",
+    "multimedia_content_service": "Backend.AI.multimedia.content_generation",
+    "sentiment_behavior_service": "Backend.AI.analysis.sentiment_behavior",
 
-# Import analytics services
-try:
-    from Backend.Analytics.business_intelligence import business_intelligence_service
-    from Backend.Analytics.analytics_service import ultra_analytics_service
-    from Backend.Analytics.bi.dashboard_service import bi_dashboard_service
-    from Backend.Analytics.ml.ml_predictions import ml_predictions
-    from Backend.Analytics.realtime.realtime_reports import realtime_reporting
-except ImportError:
-    # Create mock objects if Backend modules are not available
-    business_intelligence_service = None
-    ultra_analytics_service = None
-    bi_dashboard_service = None
-    ml_predictions = None
-    realtime_reporting = None
+    # Analytics services
+    "business_intelligence_service": "Backend.Analytics.business_intelligence",
+    "ultra_analytics_service": "Backend.Analytics.analytics_service",
+    "bi_dashboard_service": "Backend.Analytics.bi.dashboard_service",
+    "ml_predictions": "Backend.Analytics.ml.ml_predictions",
+    "realtime_reporting": "Backend.Analytics.realtime.realtime_reports",
 
-# Import event driven system
-try:
-    from Backend.Event_Driven.event_driven import event_driven_system
-except ImportError:
-    # Create mock objects if Backend modules are not available
-    event_driven_system = None
+    # Event driven system
+    "event_driven_system": "Backend.Event_Driven.event_driven",
 
-# Import API gateway
-try:
-    from Backend.API_Gateway.api_gateway import api_gateway
-except ImportError:
-    # Create mock objects if Backend modules are not available
-    api_gateway = None
+    # API gateway
+    "api_gateway": "Backend.API_Gateway.api_gateway",
+}
+
+
+def __getattr__(name):
+    module_path = _LAZY_SERVICES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_path), name)
+    except (ImportError, AttributeError):
+        # Backend module not available, or it does not define the service
+        value = None
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
 
 # Import middleware and cache managers
 try:
     # Try to import from actual Redis integration
-    from app.redis.middleware import global_rate_limiting_middleware, session_middleware, request_logging_middleware
-    from app.redis.cache_managers import (
+    from .middleware import global_rate_limiting_middleware, session_middleware, request_logging_middleware
+    from .cache_managers import (
         api_cache_manager, session_cluster, rate_limiter, db_cache_manager,
         postgres_cache_manager, mongodb_cache_manager, event_sourcing_manager,
         grafana_cache_manager, prometheus_cache_manager, loki_cache_manager,
         global_service_mesh, ultra_ai_manager, ultra_security_manager, ultra_analytics_engine
     )
-    from app.redis.event_types import EventType
+    from .event_types import EventType
 except ImportError:
     # Fallback to mock implementations
-    from app.redis.mock_components import (
+    from .mock_components import (
         global_rate_limiting_middleware, session_middleware, request_logging_middleware,
         api_cache_manager, session_cluster, rate_limiter, db_cache_manager,
         postgres_cache_manager, mongodb_cache_manager, event_sourcing_manager,
@@ -127,6 +103,7 @@ __all__ = [
     # Redis client functions
     "get_redis_client",
     "test_redis_connection",
+    "close_redis_connection",
     
     # Service mesh and registry
     "service_mesh",
@@ -3,7 +3,20 @@ Cache managers for FastAPI Redis integration
 Provides various cache management functionalities
 """
 
-from typing import Dict, Any
+import math
+import time
+import uuid
+from typing import Dict, Any, Tuple
+
+try:
+    from Backend.Redis.client import get_redis_client
+except ImportError:
+    from .local_redis_client import get_redis_client
+
+from .lua_scripts import SCRIPTS
+
+# Upper bound on identifiers remembered as over their fixed-window limit
+LOCAL_BLOCKLIST_MAX = 100_000
 
 
 class APICacheManager:
@@ -22,9 +35,130 @@ class SessionCluster:
 
 
 class RateLimiter:
-    """Rate limiter"""
+    """Redis-backed rate limiter"""
+    def __init__(self):
+        self.key_prefix = "rate_limit"
+        self.stats = {"requests": 0, "limited_requests": 0}
+        # name -> registered Script (EVALSHA, re-loading on NOSCRIPT)
+        self._scripts: Dict[str, Any] = {}
+        # window key -> monotonic time its fixed window resets; while blocked,
+        # repeat offenders are rejected without a Redis round trip
+        self._blocked_until: Dict[str, float] = {}
+
+    async def initialize(self):
+        """Register the Lua scripts and SCRIPT LOAD them so the first check is a plain EVALSHA"""
+        client = get_redis_client()
+        for name, source in SCRIPTS.items():
+            script = self._scripts[name] = client.register_script(source)
+            script.sha = await client.script_load(source)
+
+    def _script(self, name: str):
+        """Registered script by name, registering it on first use"""
+        script = self._scripts.get(name)
+        if script is None:
+            script = self._scripts[name] = get_redis_client().register_script(SCRIPTS[name])
+        return script
+
+    async def check_sliding_window(self, identifier: str, limit: int, window: int) -> Tuple[bool, Dict[str, Any]]:
+        """Check and record a request against a sliding window of `window` seconds"""
+        # Wall-clock (not monotonic) ms: the window is shared by every worker process.
+        # Integer score plus a short random suffix keeps same-ms requests distinct
+        now_ms = time.time_ns() // 1_000_000
+        allowed, count = await self._script("sliding_window")(
+            keys=[f"{self.key_prefix}:sliding:{identifier}"],
+            args=[now_ms, window * 1000, limit, f"{now_ms}:{uuid.uuid4().hex[:8]}"]
+        )
+
+        self.stats["requests"] += 1
+        if not allowed:
+            self.stats["limited_requests"] += 1
+
+        return bool(allowed), {
+            "count": count,
+            "limit": limit,
+            "remaining": max(0, limit - count),
+            "reset_in": window
+        }
+
+    async def check_fixed_window(self, identifier: str, limit: int, window: int) -> Tuple[bool, Dict[str, Any]]:
+        """Check and record a request against a fixed window of `window` seconds.
+
+        Cheaper than the sliding window but allows up to 2x `limit` across a
+        window boundary; use check_sliding_window when that burst matters.
+        """
+        key = f"{self.key_prefix}:fixed:{identifier}"
+        self.stats["requests"] += 1
+
+        blocked_for = self._locally_blocked_for(key)
+        if blocked_for > 0:
+            self.stats["limited_requests"] += 1
+            return False, {
+                "count": limit,
+                "limit": limit,
+                "remaining": 0,
+                "reset_in": math.ceil(blocked_for)
+            }
+
+        count, pttl = await self._script("fixed_window")(keys=[key], args=[window])
+        allowed = count <= limit
+
+        if not allowed:
+            self.stats["limited_requests"] += 1
+            if pttl > 0:
+                # The window cannot reset before its key expires, whatever other workers do
+                self._block_locally(key, pttl / 1000)
+
+        return allowed, {
+            "count": count,
+            "limit": limit,
+            "remaining": max(0, limit - count),
+            "reset_in": math.ceil(pttl / 1000) if pttl > 0 else window
+        }
+
+    def _locally_blocked_for(self, key: str) -> float:
+        """Seconds until a locally blocked window key resets (0 if not blocked)"""
+        deadline = self._blocked_until.get(key)
+        if deadline is None:
+            return 0
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            del self._blocked_until[key]
+            return 0
+        return remaining
+
+    def _block_locally(self, key: str, seconds: float):
+        """Remember that `key` is over its limit for the next `seconds`"""
+        now = time.monotonic()
+        if len(self._blocked_until) >= LOCAL_BLOCKLIST_MAX:
+            self._blocked_until = {k: d for k, d in self._blocked_until.items() if d > now}
+            if len(self._blocked_until) >= LOCAL_BLOCKLIST_MAX:
+                self._blocked_until.clear()
+        self._blocked_until[key] = now + seconds
+
+    async def check_token_bucket(self, identifier: str, capacity: int, refill_per_sec: float, cost: int = 1) -> Tuple[bool, Dict[str, Any]]:
+        """Consume `cost` tokens from a bucket of `capacity` refilled at `refill_per_sec`"""
+        # The script derives the key TTL from capacity / rate; zero would make it inf/nan
+        if capacity <= 0 or refill_per_sec <= 0:
+            raise ValueError("capacity and refill_per_sec must be positive")
+        allowed, tokens = await self._script("token_bucket")(
+            keys=[f"{self.key_prefix}:bucket:{identifier}"],
+            args=[capacity, refill_per_sec, time.time(), cost]
+        )
+        tokens = float(tokens)
+
+        self.stats["requests"] += 1
+        if not allowed:
+            self.stats["limited_requests"] += 1
+
+        return bool(allowed), {
+            "tokens": tokens,
+            "capacity": capacity,
+            "remaining": int(tokens // cost) if cost else int(tokens),
+            "retry_after": 0 if allowed else (cost - tokens) / refill_per_sec
+        }
+
     def get_rate_limit_stats(self):
-        return {"status": "operational", "requests": 0}
+        return {"status": "operational", **self.stats}
 
 
 class DBCacheManager:
@@ -0,0 +1,61 @@
+"""
+Lua scripts for FastAPI Redis integration
+Loaded once per process and invoked by SHA (EVALSHA)
+"""
+
+
+# Sliding-window log: trim expired entries, count and record the request in a
+# single atomic round-trip. KEYS[1]=window key; ARGV=now_ms, window_ms, limit, member
+SLIDING_WINDOW_LUA = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[4])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return {1, count + 1}
+end
+return {0, count}
+"""
+
+# Fixed window counter: O(1) memory per identifier instead of one member per
+# request. KEYS[1]=window key; ARGV[1]=window seconds. Returns {count, pttl}
+FIXED_WINDOW_LUA = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return {count, redis.call('PTTL', KEYS[1])}
+"""
+
+# Token bucket kept in a hash {t: tokens, ts: last refill}: refill and consume in one
+# atomic round-trip. KEYS[1]=bucket key; ARGV=capacity, refill_per_sec, now (s), cost.
+# Tokens are returned as a string because Redis truncates Lua numbers to integers
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local bucket = redis.call('HMGET', KEYS[1], 't', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 't', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(tokens)}
+"""
+
+
+# Registry used to register and SCRIPT LOAD every script at startup
+SCRIPTS = {
+    "sliding_window": SLIDING_WINDOW_LUA,
+    "fixed_window": FIXED_WINDOW_LUA,
+    "token_bucket": TOKEN_BUCKET_LUA,
+}
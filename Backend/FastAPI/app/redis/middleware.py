@@ -5,12 +5,44 @@ Provides rate limiting, session management, and request logging
 
 from fastapi import Request, Response
 from typing import Callable, Awaitable
+import math
+import os
 import time
 
+from .cache_managers import rate_limiter
+
+# Requests per minute allowed per client IP; 0 disables Redis-backed limiting
+RATE_LIMIT_PER_MINUTE = int(os.getenv("FASTAPI_RATE_LIMIT_PER_MINUTE", "0"))
+# "fixed" (per-minute window) or "token_bucket" (bursts up to the limit, refilled evenly)
+RATE_LIMIT_ALGORITHM = os.getenv("FASTAPI_RATE_LIMIT_ALGORITHM", "fixed")
+# 429 body is constant, so it is serialized once
+_RATE_LIMITED_BODY = b'{"detail":"Rate limit exceeded"}'
+
 
 async def global_rate_limiting_middleware(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
     """Global rate limiting middleware"""
-    # In a real implementation, this would check rate limits using Redis
+    if RATE_LIMIT_PER_MINUTE > 0:
+        client_ip = request.client.host if request.client else "unknown"
+        try:
+            if RATE_LIMIT_ALGORITHM == "token_bucket":
+                allowed, rate_info = await rate_limiter.check_token_bucket(
+                    client_ip, RATE_LIMIT_PER_MINUTE, RATE_LIMIT_PER_MINUTE / 60
+                )
+                retry_after = math.ceil(rate_info["retry_after"])
+            else:
+                allowed, rate_info = await rate_limiter.check_fixed_window(client_ip, RATE_LIMIT_PER_MINUTE, 60)
+                retry_after = rate_info["reset_in"]
+        except Exception:
+            # Fail open if Redis is unavailable
+            allowed = True
+        if not allowed:
+            return Response(
+                _RATE_LIMITED_BODY,
+                status_code=429,
+                media_type="application/json",
+                headers={"Retry-After": str(retry_after)}
+            )
+
     response = await call_next(request)
     return response
 
@@ -24,8 +56,8 @@ async def session_middleware(request: Request, call_next: Callable[[Request], Aw
 
 async def request_logging_middleware(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
     """Request logging middleware"""
-    start_time = time.time()
+    start_time = time.perf_counter()
     response = await call_next(request)
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     response.headers["X-Process-Time"] = str(process_time)
     return response
\ No newline at end of file
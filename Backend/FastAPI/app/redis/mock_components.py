@@ -23,9 +23,9 @@ async def session_middleware(request: Request, call_next: Callable[[Request], Aw
 
 async def request_logging_middleware(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
     """Mock request logging middleware"""
-    start_time = time.time()
+    start_time = time.perf_counter()
     response = await call_next(request)
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     response.headers["X-Process-Time"] = str(process_time)
     return response
 
@@ -57,6 +57,18 @@ class MockSessionCluster:
 
 class MockRateLimiter:
     """Mock rate limiter"""
+    async def initialize(self):
+        pass
+
+    async def check_sliding_window(self, identifier: str, limit: int, window: int):
+        return True, {"count": 0, "limit": limit, "remaining": limit, "reset_in": window}
+
+    async def check_fixed_window(self, identifier: str, limit: int, window: int):
+        return True, {"count": 0, "limit": limit, "remaining": limit, "reset_in": window}
+
+    async def check_token_bucket(self, identifier: str, capacity: int, refill_per_sec: float, cost: int = 1):
+        return True, {"tokens": capacity, "capacity": capacity, "remaining": capacity, "retry_after": 0}
+
     def get_rate_limit_stats(self):
         return {"status": "mock", "requests": 0}
 
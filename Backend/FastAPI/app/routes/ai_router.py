@@ -4,8 +4,11 @@ from typing import Any, Dict, Optional
 import json
 import asyncio
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import BaseModel
 
 # Ensure Backend package is importable when running standalone
@@ -20,14 +23,32 @@ except Exception as e:
 
 # Redis client e broker híbrido
 try:
-    from app.redis import get_redis_client
-    from app.redis import hybrid_broker
+    from ..redis import get_redis_client
+    from ..redis import hybrid_broker
 except Exception:
     get_redis_client = None
     hybrid_broker = None
 
 
-ai_router = APIRouter(prefix="/ai", tags=["ai"])
+class _ErrorDetailRoute(APIRoute):
+    """Converte erros inesperados dos endpoints em HTTP 500 com a mensagem do erro."""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                # Inclui os HTTPException do Starlette (ex.: 404/405 de dependências)
+                raise
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+
+        return route_handler
+
+
+ai_router = APIRouter(prefix="/ai", tags=["ai"], route_class=_ErrorDetailRoute)
 
 
 class ChatRequest(BaseModel):
@@ -54,19 +75,13 @@ class AssistRequest(BaseModel):
 @ai_router.get("/providers")
 def providers_status():
     """Retorna status de provedores de IA disponíveis."""
-    try:
-        return ultra_ai_service.get_provider_status()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return ultra_ai_service.get_provider_status()
 
 
 @ai_router.get("/models")
 def available_models():
     """Lista de modelos disponíveis no serviço de IA."""
-    try:
-        return ultra_ai_service.get_available_models()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return ultra_ai_service.get_available_models()
 
 
 def _role_instructions(role: str) -> str:
@@ -101,16 +116,20 @@ def _conv_key(user_id: Optional[str], session_id: Optional[str], conversation_id
     return f"sec:ai:conversation:{base}"
 
 
-async def _save_event(conv_key: str, entry: Dict[str, Any]):
-    """Salva um evento de conversa no Redis (lista cronológica)."""
+async def _save_event(conv_key: str, *entries: Dict[str, Any]):
+    """Salva eventos de conversa no Redis (lista cronológica) em uma única ida ao servidor."""
     if not get_redis_client:
         return
     try:
-        client = get_redis_client()
-        entry["ts"] = int(asyncio.get_event_loop().time() * 1000)
-        await client.rpush(conv_key, json.dumps(entry, default=str))
+        ts = int(asyncio.get_event_loop().time() * 1000)
+        for entry in entries:
+            entry["ts"] = ts
+        pipe = get_redis_client().pipeline(transaction=False)
+        # RPUSH variádico preserva a ordem dos eventos
+        pipe.rpush(conv_key, *(json.dumps(entry, default=str) for entry in entries))
         # Expira conversas inativas em 7 dias
-        await client.expire(conv_key, 7 * 24 * 3600)
+        pipe.expire(conv_key, 7 * 24 * 3600)
+        await pipe.execute()
     except Exception:
         # Não interrompe fluxo em caso de erro de cache
         pass
@@ -119,102 +138,94 @@ async def _save_event(conv_key: str, entry: Dict[str, Any]):
 @ai_router.post("/chat")
 async def chat(req: ChatRequest):
     """Atendimento geral por chat com contexto de papel (role)."""
-    try:
-        model_id = req.model_id or "gemini-2.5-flash-lite"
-        instructions = _role_instructions(req.role)
-        input_data: Dict[str, Any] = {
-            "system_instructions": instructions,
-            "user_message": req.message,
-            "role": req.role,
-            "context": req.context or {},
-        }
-
-        pred = await ultra_ai_service.make_prediction(
-            PredictionRequest(
-                model_id=model_id,
-                input_data=input_data,
-                context={"source": "fastapi.ai_router", "feature": "chat"},
-                provider=AIProvider.GEMINI,
-            )
+    model_id = req.model_id or "gemini-2.5-flash-lite"
+    instructions = _role_instructions(req.role)
+    input_data: Dict[str, Any] = {
+        "system_instructions": instructions,
+        "user_message": req.message,
+        "role": req.role,
+        "context": req.context or {},
+    }
+
+    pred = await ultra_ai_service.make_prediction(
+        PredictionRequest(
+            model_id=model_id,
+            input_data=input_data,
+            context={"source": "fastapi.ai_router", "feature": "chat"},
+            provider=AIProvider.GEMINI,
         )
-        # Memória de conversa
-        conv_key = _conv_key(req.user_id, req.session_id, req.conversation_id)
-        await _save_event(conv_key, {"type": "user", "role": req.role, "message": req.message})
-        await _save_event(conv_key, {
-            "type": "assistant",
-            "role": req.role,
-            "text": pred.result,
-            "provider": pred.provider.value,
-            "model_id": pred.model_id
-        })
-
-        return {
-            "text": pred.result,
-            "provider": pred.provider.value,
-            "model_id": pred.model_id,
-            "confidence": pred.confidence,
-            "latency": pred.processing_time,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    )
+    # Memória de conversa
+    conv_key = _conv_key(req.user_id, req.session_id, req.conversation_id)
+    await _save_event(conv_key, {"type": "user", "role": req.role, "message": req.message}, {
+        "type": "assistant",
+        "role": req.role,
+        "text": pred.result,
+        "provider": pred.provider.value,
+        "model_id": pred.model_id
+    })
+
+    return {
+        "text": pred.result,
+        "provider": pred.provider.value,
+        "model_id": pred.model_id,
+        "confidence": pred.confidence,
+        "latency": pred.processing_time,
+    }
 
 
 @ai_router.post("/assist")
 async def assist(req: AssistRequest):
     """Assistente especializado por tópico (agenda, programação, ingressos, etc.)."""
-    try:
-        model_id = req.model_id or "gemini-2.5-flash-lite"
-        role_instr = _role_instructions(req.role)
-        topic = (req.topic or "geral").strip().lower()
-
-        topic_instr = {
-            "agenda": "Explique agenda, horários e disponibilidade com precisão e objetividade.",
-            "programacao": "Mostre eventos em destaque, trilhas e recomendações conforme perfil informado.",
-            "ingressos": "Detalhe valores, gratuidades, meia-entrada, políticas de devolução e canais de compra.",
-            "acessibilidade": "Informe recursos de acessibilidade disponíveis e como solicitar apoio.",
-            "localizacao": "Oriente quanto a endereço, transporte, estacionamento e pontos de referência.",
-            "inscricoes": "Guie sobre prazos, requisitos, documentação e critérios de avaliação.",
-            "submissoes": "Esclareça formatos aceitos, diretrizes técnicas e direitos autorais.",
-        }.get(topic, "Responda de forma prática e direcionada ao tópico solicitado.")
-
-        instructions = f"{role_instr} {topic_instr}"
-        input_data: Dict[str, Any] = {
-            "system_instructions": instructions,
-            "user_message": req.message,
-            "role": req.role,
-            "topic": topic,
-            "context": req.context or {},
-        }
-
-        pred = await ultra_ai_service.make_prediction(
-            PredictionRequest(
-                model_id=model_id,
-                input_data=input_data,
-                context={"source": "fastapi.ai_router", "feature": "assist", "topic": topic},
-                provider=AIProvider.GEMINI,
-            )
+    model_id = req.model_id or "gemini-2.5-flash-lite"
+    role_instr = _role_instructions(req.role)
+    topic = (req.topic or "geral").strip().lower()
+
+    topic_instr = {
+        "agenda": "Explique agenda, horários e disponibilidade com precisão e objetividade.",
+        "programacao": "Mostre eventos em destaque, trilhas e recomendações conforme perfil informado.",
+        "ingressos": "Detalhe valores, gratuidades, meia-entrada, políticas de devolução e canais de compra.",
+        "acessibilidade": "Informe recursos de acessibilidade disponíveis e como solicitar apoio.",
+        "localizacao": "Oriente quanto a endereço, transporte, estacionamento e pontos de referência.",
+        "inscricoes": "Guie sobre prazos, requisitos, documentação e critérios de avaliação.",
+        "submissoes": "Esclareça formatos aceitos, diretrizes técnicas e direitos autorais.",
+    }.get(topic, "Responda de forma prática e direcionada ao tópico solicitado.")
+
+    instructions = f"{role_instr} {topic_instr}"
+    input_data: Dict[str, Any] = {
+        "system_instructions": instructions,
+        "user_message": req.message,
+        "role": req.role,
+        "topic": topic,
+        "context": req.context or {},
+    }
+
+    pred = await ultra_ai_service.make_prediction(
+        PredictionRequest(
+            model_id=model_id,
+            input_data=input_data,
+            context={"source": "fastapi.ai_router", "feature": "assist", "topic": topic},
+            provider=AIProvider.GEMINI,
         )
-        # Memória de conversa
-        conv_key = _conv_key(req.user_id, req.session_id, req.conversation_id)
-        await _save_event(conv_key, {"type": "user", "role": req.role, "topic": topic, "message": req.message})
-        await _save_event(conv_key, {
-            "type": "assistant",
-            "role": req.role,
-            "topic": topic,
-            "text": pred.result,
-            "provider": pred.provider.value,
-            "model_id": pred.model_id
-        })
-
-        return {
-            "text": pred.result,
-            "provider": pred.provider.value,
-            "model_id": pred.model_id,
-            "confidence": pred.confidence,
-            "latency": pred.processing_time,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    )
+    # Memória de conversa
+    conv_key = _conv_key(req.user_id, req.session_id, req.conversation_id)
+    await _save_event(conv_key, {"type": "user", "role": req.role, "topic": topic, "message": req.message}, {
+        "type": "assistant",
+        "role": req.role,
+        "topic": topic,
+        "text": pred.result,
+        "provider": pred.provider.value,
+        "model_id": pred.model_id
+    })
+
+    return {
+        "text": pred.result,
+        "provider": pred.provider.value,
+        "model_id": pred.model_id,
+        "confidence": pred.confidence,
+        "latency": pred.processing_time,
+    }
 
 
 @ai_router.get("/ping")
@@ -284,61 +295,51 @@ async def chat_stream(
 @ai_router.post("/chat/queue")
 async def chat_queue(req: ChatRequest):
     """Enfileira requisição de chat no broker híbrido (RabbitMQ/Redis)."""
-    try:
-        message = {
-            "type": "chat_request",
-            "role": req.role,
-            "message": req.message,
-            "model_id": req.model_id or "gemini-2.5-flash-lite",
-            "context": req.context or {},
-            "user_id": req.user_id,
-            "session_id": req.session_id,
-            "conversation_id": req.conversation_id
-        }
-
-        if hybrid_broker is None:
-            raise HTTPException(status_code=503, detail="Message broker indisponível")
-
-        # Prioridade normal; publica em modo híbrido
-        msg_id = await hybrid_broker.publish_message(
-            message,
-            routing_key="ai.chat",
-            stream_name="ai_chat_requests"
-        )
+    message = {
+        "type": "chat_request",
+        "role": req.role,
+        "message": req.message,
+        "model_id": req.model_id or "gemini-2.5-flash-lite",
+        "context": req.context or {},
+        "user_id": req.user_id,
+        "session_id": req.session_id,
+        "conversation_id": req.conversation_id
+    }
+
+    if hybrid_broker is None:
+        raise HTTPException(status_code=503, detail="Message broker indisponível")
+
+    # Prioridade normal; publica em modo híbrido
+    msg_id = await hybrid_broker.publish_message(
+        message,
+        routing_key="ai.chat",
+        stream_name="ai_chat_requests"
+    )
 
-        return {"status": "queued", "message_id": msg_id}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "queued", "message_id": msg_id}
 
 
 @ai_router.post("/assist/queue")
 async def assist_queue(req: AssistRequest):
     """Enfileira requisição de assistente no broker híbrido (RabbitMQ/Redis)."""
-    try:
-        message = {
-            "type": "assist_request",
-            "role": req.role,
-            "topic": (req.topic or "geral").strip().lower(),
-            "message": req.message,
-            "model_id": req.model_id or "gemini-2.5-flash-lite",
-            "context": req.context or {},
-            "user_id": req.user_id,
-            "session_id": req.session_id,
-            "conversation_id": req.conversation_id
-        }
-
-        if hybrid_broker is None:
-            raise HTTPException(status_code=503, detail="Message broker indisponível")
-
-        msg_id = await hybrid_broker.publish_message(
-            message,
-            routing_key="ai.assist",
-            stream_name="ai_assist_requests"
-        )
-        return {"status": "queued", "message_id": msg_id}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    message = {
+        "type": "assist_request",
+        "role": req.role,
+        "topic": (req.topic or "geral").strip().lower(),
+        "message": req.message,
+        "model_id": req.model_id or "gemini-2.5-flash-lite",
+        "context": req.context or {},
+        "user_id": req.user_id,
+        "session_id": req.session_id,
+        "conversation_id": req.conversation_id
+    }
+
+    if hybrid_broker is None:
+        raise HTTPException(status_code=503, detail="Message broker indisponível")
+
+    msg_id = await hybrid_broker.publish_message(
+        message,
+        routing_key="ai.assist",
+        stream_name="ai_assist_requests"
+    )
+    return {"status": "queued", "message_id": msg_id}
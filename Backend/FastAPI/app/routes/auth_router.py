@@ -12,6 +12,7 @@ from ..auth import (
     require_auth,
     audit_log,
     create_access_token,
+    run_blocking,
 )
 
 logger = logging.getLogger("sec-fastapi")
@@ -69,7 +70,7 @@ async def login(request: Request):
         try:
             if isinstance(stored_password, str) and stored_password.startswith("$2"):
                 import bcrypt  # type: ignore
-                valid_password = bcrypt.checkpw(password.encode("utf-8"), stored_password.encode("utf-8"))
+                valid_password = await run_blocking(request, bcrypt.checkpw, password.encode("utf-8"), stored_password.encode("utf-8"))
             else:
                 valid_password = False
         except Exception:
@@ -238,7 +239,7 @@ async def change_password(payload: ChangePasswordPayload, request: Request, curr
             try:
                 if isinstance(stored_password, str) and stored_password.startswith("$2"):
                     import bcrypt  # type: ignore
-                    valid_password = bcrypt.checkpw(payload.current_password.encode("utf-8"), stored_password.encode("utf-8"))
+                    valid_password = await run_blocking(request, bcrypt.checkpw, payload.current_password.encode("utf-8"), stored_password.encode("utf-8"))
                 else:
                     valid_password = False
             except Exception:
@@ -256,7 +257,7 @@ async def change_password(payload: ChangePasswordPayload, request: Request, curr
         # Gerar hash bcrypt para a nova senha
         import bcrypt
         salt = bcrypt.gensalt(rounds=11)
-        hashed = bcrypt.hashpw(payload.new_password.encode("utf-8"), salt).decode("utf-8")  # $2b$
+        hashed = (await run_blocking(request, bcrypt.hashpw, payload.new_password.encode("utf-8"), salt)).decode("utf-8")  # $2b$
 
         # Atualizar senha e auditoria
         updated = await instrumented_fetchrow(
@@ -0,0 +1,103 @@
+"""
+Event-driven system tests
+Publishes and consumes events through Redis Streams against fakeredis
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+import fakeredis.aioredis
+
+# Ensure the Backend package (repository root) is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Backend.Event_Driven import event_driven
+from Backend.Event_Driven.event_driven import EventDrivenSystem, EventType
+from Backend.Message_Broker.message_broker import HybridMessageBroker
+
+
+class _YieldingFakeRedis(fakeredis.aioredis.FakeRedis):
+    """fakeredis answers a blocking XREADGROUP at once; yield so the read loop cannot starve the test"""
+
+    async def xreadgroup(self, *args, **kwargs):
+        await asyncio.sleep(0.01)
+        return await super().xreadgroup(*args, **kwargs)
+
+
+@pytest.fixture
+def system(monkeypatch):
+    """Event system and the broker it publishes to, sharing one fakeredis server"""
+    redis_client = _YieldingFakeRedis(decode_responses=True)
+    broker = HybridMessageBroker()
+    broker.redis_client = redis_client
+    monkeypatch.setattr(event_driven, "hybrid_broker", broker)
+    system = EventDrivenSystem()
+    system.redis_client = redis_client
+    return system
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+async def _consume_until(system, condition, timeout=2.0):
+    """Run consume_events until `condition()` holds, then stop it"""
+    consumer = asyncio.create_task(system.consume_events())
+    try:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not condition():
+            assert asyncio.get_running_loop().time() < deadline, "consumer did not catch up"
+            await asyncio.sleep(0.01)
+    finally:
+        consumer.cancel()
+        await asyncio.gather(consumer, return_exceptions=True)
+        await event_driven.hybrid_broker.close()
+
+
+class TestEventStream:
+    """publish_event -> consume_events -> handlers"""
+
+    def test_handlers_receive_published_payload(self, system):
+        received = []
+
+        async def handler(event_data):
+            received.append(event_data)
+
+        async def scenario():
+            await system.register_event_handler(EventType.USER_CREATED, handler)
+            consumer = asyncio.create_task(_consume_until(system, lambda: received))
+            await asyncio.sleep(0.05)  # consumer group created at "$" before publishing
+            event_id = await system.publish_event(
+                EventType.USER_CREATED,
+                {"user": {"id": 1, "roles": ["admin"]}},
+                "auth",
+                metadata={"ip": "10.0.0.1"}
+            )
+            await consumer
+            return event_id
+
+        event_id = _run(scenario())
+        assert received[0]["event_id"] == event_id
+        assert received[0]["event_type"] == EventType.USER_CREATED.value
+        assert received[0]["payload"] == {"user": {"id": 1, "roles": ["admin"]}}
+        assert received[0]["metadata"] == {"ip": "10.0.0.1"}
+        assert received[0].get("correlation_id") is None
+
+    def test_failed_events_are_acknowledged(self, system):
+        async def scenario():
+            consumer = asyncio.create_task(
+                _consume_until(system, lambda: system.stats["errors"] == 1)
+            )
+            await asyncio.sleep(0.05)
+            # payload is not valid JSON, so decoding the entry fails
+            await system.redis_client.xadd(
+                f"{system.event_prefix}:stream",
+                {"event_type": EventType.USER_CREATED.value, "payload": "{not json"}
+            )
+            await consumer
+            return await system.redis_client.xpending(f"{system.event_prefix}:stream", "event_group")
+
+        pending = _run(scenario())
+        assert pending["pending"] == 0
@@ -173,6 +173,13 @@ class TestAPI:
         assert response.status_code == 200
         assert response.json() == {"status": "healthy"}
 
+    def test_health_endpoint_not_modified(self, client):
+        """Test health check honours If-None-Match"""
+        etag = client.get("/health").headers["etag"]
+        response = client.get("/health", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
     def test_api_docs_accessible(self, client):
         """Test API documentation is accessible"""
         response = client.get("/docs")
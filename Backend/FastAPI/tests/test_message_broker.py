@@ -0,0 +1,72 @@
+"""
+Message broker tests
+Publishes to Redis Streams through HybridMessageBroker against fakeredis
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+import fakeredis.aioredis
+
+# Ensure the Backend package (repository root) is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+
+from Backend.Message_Broker.message_broker import (
+    HybridMessageBroker,
+    MessageBrokerType,
+    MESSAGE_JSON_FIELDS,
+    decode_stream_fields,
+)
+
+
+@pytest.fixture
+def broker():
+    """Broker whose Redis Streams writes go to a fresh fakeredis server"""
+    broker = HybridMessageBroker()
+    broker.redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return broker
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestRedisStreamsPublish:
+    """publish_message with broker_type=REDIS"""
+
+    def test_publish_single_message(self, broker):
+        async def scenario():
+            message_id = await broker.publish_message(
+                {"user_id": "u1", "text": "olá"},
+                routing_key="ai.chat",
+                broker_type=MessageBrokerType.REDIS
+            )
+            entries = await broker.redis_client.xrange("message_streams:ai.chat")
+            await broker.close()
+            return message_id, entries
+
+        message_id, entries = _run(scenario())
+        assert [entry_id for entry_id, _ in entries] == [message_id]
+
+        fields = decode_stream_fields(entries[0][1], MESSAGE_JSON_FIELDS)
+        assert fields["data"] == {"user_id": "u1", "text": "olá"}
+        assert fields["metadata"]["source"] == "backend"
+        assert fields["routing_key"] == "ai.chat"
+
+    def test_publish_concurrent_burst(self, broker):
+        async def scenario():
+            message_ids = await asyncio.gather(*(
+                broker.publish_message({"n": i}, routing_key="burst", broker_type=MessageBrokerType.REDIS)
+                for i in range(100)
+            ))
+            entries = await broker.redis_client.xrange("message_streams:burst")
+            await broker.close()
+            return message_ids, entries
+
+        message_ids, entries = _run(scenario())
+        assert len(set(message_ids)) == 100
+        assert set(message_ids) == {entry_id for entry_id, _ in entries}
+        published = sorted(decode_stream_fields(fields, MESSAGE_JSON_FIELDS)["data"]["n"] for _, fields in entries)
+        assert published == list(range(100))
@@ -0,0 +1,151 @@
+"""
+Rate limiter tests
+Runs the Lua scripts of RateLimiter against fakeredis
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+import fakeredis.aioredis
+
+# Ensure application package is importable in Docker or locally
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.redis import cache_managers
+from app.redis.cache_managers import RateLimiter
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    """RateLimiter whose scripts run on a fresh fakeredis server"""
+    redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(cache_managers, "get_redis_client", lambda: redis_client)
+    return RateLimiter()
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestSlidingWindow:
+    """Sliding-window log (SLIDING_WINDOW_LUA)"""
+
+    def test_allows_under_limit(self, limiter):
+        async def scenario():
+            return [await limiter.check_sliding_window("ip", 3, 60) for _ in range(3)]
+
+        results = _run(scenario())
+        assert [allowed for allowed, _ in results] == [True, True, True]
+        assert [info["remaining"] for _, info in results] == [2, 1, 0]
+
+    def test_denies_over_limit(self, limiter):
+        async def scenario():
+            for _ in range(2):
+                await limiter.check_sliding_window("ip", 2, 60)
+            return await limiter.check_sliding_window("ip", 2, 60)
+
+        allowed, info = _run(scenario())
+        assert not allowed
+        assert info["count"] == 2
+        assert limiter.get_rate_limit_stats()["limited_requests"] == 1
+
+    def test_window_slides(self, limiter):
+        async def scenario():
+            await limiter.check_sliding_window("ip", 1, 1)
+            denied, _ = await limiter.check_sliding_window("ip", 1, 1)
+            await asyncio.sleep(1.1)
+            allowed, _ = await limiter.check_sliding_window("ip", 1, 1)
+            return denied, allowed
+
+        denied, allowed = _run(scenario())
+        assert not denied
+        assert allowed
+
+    def test_identifiers_are_independent(self, limiter):
+        async def scenario():
+            await limiter.check_sliding_window("a", 1, 60)
+            return await limiter.check_sliding_window("b", 1, 60)
+
+        allowed, _ = _run(scenario())
+        assert allowed
+
+
+class TestFixedWindow:
+    """Fixed-window counter (FIXED_WINDOW_LUA) and the local blocklist"""
+
+    def test_allows_under_limit_and_denies_over(self, limiter):
+        async def scenario():
+            return [await limiter.check_fixed_window("ip", 2, 60) for _ in range(3)]
+
+        results = _run(scenario())
+        assert [allowed for allowed, _ in results] == [True, True, False]
+        assert 0 < results[-1][1]["reset_in"] <= 60
+
+    def test_blocked_identifier_skips_redis(self, limiter, monkeypatch):
+        async def scenario():
+            for _ in range(2):
+                await limiter.check_fixed_window("ip", 1, 60)
+
+            def no_redis(name):
+                raise AssertionError("blocked identifier must not reach Redis")
+
+            monkeypatch.setattr(limiter, "_script", no_redis)
+            return await limiter.check_fixed_window("ip", 1, 60)
+
+        allowed, info = _run(scenario())
+        assert not allowed
+        assert info["remaining"] == 0
+
+    def test_window_resets(self, limiter):
+        async def scenario():
+            await limiter.check_fixed_window("ip", 1, 1)
+            denied, _ = await limiter.check_fixed_window("ip", 1, 1)
+            await asyncio.sleep(1.1)
+            allowed, _ = await limiter.check_fixed_window("ip", 1, 1)
+            return denied, allowed
+
+        denied, allowed = _run(scenario())
+        assert not denied
+        assert allowed
+
+    def test_blocklist_is_bounded(self, limiter, monkeypatch):
+        monkeypatch.setattr(cache_managers, "LOCAL_BLOCKLIST_MAX", 3)
+        for i in range(10):
+            limiter._block_locally(f"key{i}", 60)
+        assert len(limiter._blocked_until) <= 3
+
+
+class TestTokenBucket:
+    """Token bucket (TOKEN_BUCKET_LUA)"""
+
+    def test_allows_burst_then_denies(self, limiter, monkeypatch):
+        monkeypatch.setattr(cache_managers.time, "time", lambda: 1000.0)
+
+        async def scenario():
+            return [await limiter.check_token_bucket("ip", 2, 1) for _ in range(3)]
+
+        results = _run(scenario())
+        assert [allowed for allowed, _ in results] == [True, True, False]
+        assert results[-1][1]["retry_after"] == pytest.approx(1.0)
+
+    def test_refills_over_time(self, limiter, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(cache_managers.time, "time", lambda: clock[0])
+
+        async def scenario():
+            await limiter.check_token_bucket("ip", 1, 2)
+            denied, _ = await limiter.check_token_bucket("ip", 1, 2)
+            clock[0] += 0.5
+            allowed, info = await limiter.check_token_bucket("ip", 1, 2)
+            return denied, allowed, info
+
+        denied, allowed, info = _run(scenario())
+        assert not denied
+        assert allowed
+        assert info["tokens"] == pytest.approx(0.0)
+
+    def test_rejects_non_positive_rate(self, limiter):
+        with pytest.raises(ValueError):
+            _run(limiter.check_token_bucket("ip", 10, 0))
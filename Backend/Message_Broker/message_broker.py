@@ -4,13 +4,50 @@ Hybrid message broker with Redis Streams and RabbitMQ integration
 """
 import asyncio
 import json
+import random
 import time
 from typing import Dict, Any, List, Optional, Callable
 from enum import Enum
 
 import aio_pika
+import ormsgpack
+from redis.exceptions import DataError
 from ..Redis.client import get_redis_client
 
+# Consumer retry backoff after stream errors: doubles from the base up to the cap,
+# plus up to the same again in jitter so consumers do not reconnect in lockstep
+CONSUMER_RETRY_BASE_DELAY = 1.0
+CONSUMER_RETRY_MAX_DELAY = 30.0
+
+# A consumer logs a persisting stream error at most this often (seconds)
+CONSUMER_ERROR_LOG_INTERVAL = 60
+
+# Nested fields of the enriched broker message, stored as JSON in Redis Streams
+MESSAGE_JSON_FIELDS = ("data", "metadata")
+
+
+def encode_stream_fields(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a message into XADD fields.
+
+    Redis Streams only take str/bytes/int/float values: nested values are
+    stored as JSON strings and None fields are left out.
+    """
+    return {
+        field: value if isinstance(value, (str, int, float)) and not isinstance(value, bool)
+        else json.dumps(value, default=str)
+        for field, value in message.items()
+        if value is not None
+    }
+
+
+def decode_stream_fields(fields: Dict[str, Any], json_fields) -> Dict[str, Any]:
+    """Undo encode_stream_fields for the given nested fields of a stream entry"""
+    decoded = dict(fields)
+    for field in json_fields:
+        if field in decoded:
+            decoded[field] = json.loads(decoded[field])
+    return decoded
+
 
 class MessagePriority(Enum):
     """Message priority levels"""
@@ -37,6 +74,11 @@ class HybridMessageBroker:
         self.rabbitmq_channel: Optional[aio_pika.Channel] = None
         self.redis_streams_prefix = "message_streams"
 
+        # Concurrent Redis Streams publishes are coalesced into one pipeline
+        self.max_publish_batch = 64
+        self._redis_publish_queue: Optional[asyncio.Queue] = None
+        self._redis_publisher_task: Optional[asyncio.Task] = None
+
         # Message broker statistics
         self.stats = {
             "messages_sent": 0,
@@ -73,6 +115,16 @@ class HybridMessageBroker:
 
     async def close(self):
         """Close connections"""
+        if self._redis_publisher_task:
+            task = self._redis_publisher_task
+            self._redis_publisher_task = None
+            self._redis_publish_queue = None
+            task.cancel()
+            try:
+                # Let the publisher fail whatever is still queued before returning
+                await task
+            except asyncio.CancelledError:
+                pass
         if self.rabbitmq_connection:
             await self.rabbitmq_connection.close()
 
@@ -135,10 +187,13 @@ class HybridMessageBroker:
         try:
             stream_key = f"{self.redis_streams_prefix}:{stream_name}"
 
-            message_id = await self.redis_client.xadd(
-                stream_key,
-                message
-            )
+            if self._redis_publisher_task is None or self._redis_publisher_task.done():
+                self._redis_publish_queue = asyncio.Queue()
+                self._redis_publisher_task = asyncio.create_task(self._run_redis_publisher())
+
+            future = asyncio.get_running_loop().create_future()
+            self._redis_publish_queue.put_nowait((stream_key, encode_stream_fields(message), future))
+            message_id = await future
 
             self.stats["redis_streams_messages"] += 1
             return message_id
@@ -146,16 +201,66 @@ class HybridMessageBroker:
             print(f"Redis publish error: {e}")
             raise
 
+    async def _run_redis_publisher(self):
+        """Flush queued XADDs in pipelines of up to max_publish_batch.
+
+        Whatever queued up while the previous flush was in flight goes out
+        together, so a lone publish is sent immediately and bursts share one
+        round trip.
+        """
+        queue = self._redis_publish_queue
+        batch = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < self.max_publish_batch and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                try:
+                    pipe = self.redis_client.pipeline(transaction=False)
+                    for stream_key, message, _ in batch:
+                        pipe.xadd(stream_key, message)
+                    results = await pipe.execute(raise_on_error=False)
+                except DataError:
+                    # A message that cannot be encoded fails the whole pipeline before
+                    # anything is sent; retry one by one so only that message fails
+                    results = await asyncio.gather(
+                        *(self.redis_client.xadd(stream_key, message) for stream_key, message, _ in batch),
+                        return_exceptions=True
+                    )
+                except Exception as e:
+                    # Connection/timeout errors: the server may already have applied the
+                    # pipeline, so fail the batch instead of resending and duplicating it
+                    results = [e] * len(batch)
+
+                for (_, _, future), result in zip(batch, results):
+                    if future.done():
+                        continue  # caller was cancelled
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+                batch = []
+        finally:
+            # Closed or crashed: nothing will flush the rest, so fail it instead of leaving callers waiting
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Redis Streams publisher stopped"))
+
     async def _publish_to_rabbitmq(self, message: Dict[str, Any], routing_key: str) -> str:
         """Publish message to RabbitMQ"""
         try:
             exchange = await self.rabbitmq_channel.get_exchange('sec_cc_exchange')
 
-            message_body = json.dumps(message, default=str).encode()
+            # Binary msgpack body: smaller on the wire and faster to parse than JSON
+            message_body = ormsgpack.packb(message, default=str)
 
             await exchange.publish(
                 aio_pika.Message(
                     body=message_body,
+                    content_type="application/msgpack",
                     delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
                     priority=message["priority"]
                 ),
@@ -220,6 +325,8 @@ class HybridMessageBroker:
                 # Group already exists
                 pass
 
+            retry_delay = CONSUMER_RETRY_BASE_DELAY
+            last_error_log = 0.0
             while True:
                 try:
                     # Read messages from stream
@@ -230,13 +337,14 @@ class HybridMessageBroker:
                         count=10,
                         block=5000  # 5 seconds timeout
                     )
+                    retry_delay = CONSUMER_RETRY_BASE_DELAY
 
                     for stream_messages in messages:
                         stream, msgs = stream_messages
                         for message_id, message_data in msgs:
                             try:
                                 # Process message
-                                await callback(message_data)
+                                await callback(decode_stream_fields(message_data, MESSAGE_JSON_FIELDS))
 
                                 # Acknowledge message
                                 await self.redis_client.xack(stream_key, group_name, message_id)
@@ -249,8 +357,13 @@ class HybridMessageBroker:
                 except asyncio.TimeoutError:
                     continue  # No messages, continue waiting
                 except Exception as e:
-                    print(f"Redis stream consumption error: {e}")
-                    await asyncio.sleep(5)  # Wait before retrying
+                    now = time.monotonic()
+                    if now - last_error_log >= CONSUMER_ERROR_LOG_INTERVAL:
+                        print(f"Redis stream consumption error: {e}")
+                        last_error_log = now
+                    # Wait before retrying, backing off while the error persists
+                    await asyncio.sleep(retry_delay + random.uniform(0, retry_delay))
+                    retry_delay = min(retry_delay * 2, CONSUMER_RETRY_MAX_DELAY)
 
         except Exception as e:
             print(f"Redis stream setup error: {e}")
@@ -275,8 +388,11 @@ class HybridMessageBroker:
                 async for message in queue_iter:
                     async with message.process():
                         try:
-                            # Decode message
-                            payload = json.loads(message.body.decode())
+                            # Decode message (JSON bodies from older publishers still accepted)
+                            if message.content_type == "application/msgpack":
+                                payload = ormsgpack.unpackb(message.body)
+                            else:
+                                payload = json.loads(message.body.decode())
 
                             # Process message
                             await callback(payload)
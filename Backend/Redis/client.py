@@ -3,37 +3,85 @@ Redis Client Module
 Centralized Redis client management for the SEC application.
 """
 import os
+import socket
 import redis.asyncio as redis
 from typing import Optional
 
 
 # Redis client singleton
 _redis_client = None
+_connection_pool = None
+
+# Undecoded client singleton for serialized payloads (orjson/msgpack parse bytes directly)
+_raw_redis_client = None
+_raw_connection_pool = None
+
+
+# Probe idle pooled connections so peers dropped by a NAT/load balancer are
+# detected instead of hanging the next command (TCP_NODELAY is set by redis-py)
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+
+def _build_connection_pool(decode_responses: bool = True) -> redis.ConnectionPool:
+    """Build a shared connection pool sized for concurrent async commands"""
+    pool_kwargs = dict(
+        max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "50")),
+        decode_responses=decode_responses,
+        socket_connect_timeout=5,
+        socket_timeout=5,
+        socket_keepalive=True,
+        socket_keepalive_options=_KEEPALIVE_OPTIONS,
+        retry_on_timeout=True,
+        health_check_interval=30
+    )
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        return redis.ConnectionPool.from_url(redis_url, **pool_kwargs)
+    return redis.ConnectionPool(
+        host=os.getenv("REDIS_HOST", "localhost"),
+        port=int(os.getenv("REDIS_PORT", "6379")),
+        password=os.getenv("REDIS_PASSWORD"),
+        **pool_kwargs
+    )
 
 
 def get_redis_client() -> redis.Redis:
     """Get Redis client instance"""
-    global _redis_client
+    global _redis_client, _connection_pool
     if _redis_client is None:
-        _redis_client = redis.Redis(
-            host=os.getenv("REDIS_HOST", "localhost"),
-            port=int(os.getenv("REDIS_PORT", "6379")),
-            password=os.getenv("REDIS_PASSWORD"),
-            decode_responses=True,
-            socket_connect_timeout=5,
-            socket_timeout=5,
-            retry_on_timeout=True,
-            max_connections=20
-        )
+        _connection_pool = _build_connection_pool()
+        _redis_client = redis.Redis(connection_pool=_connection_pool)
     return _redis_client
 
 
+def get_raw_redis_client() -> redis.Redis:
+    """Get Redis client instance that returns bytes instead of str"""
+    global _raw_redis_client, _raw_connection_pool
+    if _raw_redis_client is None:
+        _raw_connection_pool = _build_connection_pool(decode_responses=False)
+        _raw_redis_client = redis.Redis(connection_pool=_raw_connection_pool)
+    return _raw_redis_client
+
+
 async def close_redis_connection():
     """Close Redis connection"""
-    global _redis_client
+    global _redis_client, _connection_pool, _raw_redis_client, _raw_connection_pool
     if _redis_client:
         await _redis_client.close()
         _redis_client = None
+    if _connection_pool:
+        await _connection_pool.disconnect()
+        _connection_pool = None
+    if _raw_redis_client:
+        await _raw_redis_client.close()
+        _raw_redis_client = None
+    if _raw_connection_pool:
+        await _raw_connection_pool.disconnect()
+        _raw_connection_pool = None
 
 
 async def test_redis_connection() -> bool:
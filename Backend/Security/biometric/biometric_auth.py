@@ -13,6 +13,9 @@ from enum import Enum
 
 from ...Redis.client import get_redis_client
 
+# Templates (and the per-type index pointing at them) live for 1 year
+TEMPLATE_TTL = 86400 * 365
+
 
 class BiometricType(Enum):
     """Biometric type enumeration"""
@@ -101,19 +104,24 @@ class BiometricAuthService:
                 last_updated=time.time()
             )
 
+            pipe = self.redis_client.pipeline(transaction=False)
+
             # Store template in Redis
-            await self.redis_client.setex(
+            pipe.setex(
                 f"{self.biometric_prefix}:template:{user_id}:{biometric_type.value}",
-                86400 * 365,  # 1 year
+                TEMPLATE_TTL,
                 json.dumps(asdict(template), default=str)
             )
 
             # Add to user's biometric types
-            self.redis_client.sadd(
+            pipe.sadd(
                 f"{self.biometric_prefix}:user_biometrics:{user_id}",
                 biometric_type.value
             )
 
+            self._index_template(pipe, user_id, biometric_type)
+            await pipe.execute()
+
             self.stats["enrollments"] += 1
 
             return True
@@ -137,16 +145,19 @@ class BiometricAuthService:
             # For demo, we'll just hash the data
             input_template = hashlib.sha256(str(biometric_data).encode()).hexdigest()
 
-            # Get all user templates for this biometric type
-            pattern = f"{self.biometric_prefix}:template:*:{biometric_type.value}"
-            template_keys = await self.redis_client.keys(pattern)
+            # Get all user templates for this biometric type from the type index
+            user_ids = await self.redis_client.smembers(self._type_index_key(biometric_type))
+            template_keys = [
+                f"{self.biometric_prefix}:template:{user_id}:{biometric_type.value}"
+                for user_id in user_ids
+            ]
+            templates = await self.redis_client.mget(template_keys) if template_keys else []
 
             # Compare with all templates
             best_match = None
             best_confidence = 0.0
 
-            for template_key in template_keys:
-                template_data = await self.redis_client.get(template_key)
+            for template_data in templates:
                 if template_data:
                     template = BiometricTemplate(**json.loads(template_data))
                     
@@ -195,6 +206,16 @@ class BiometricAuthService:
                 additional_data={"error": str(e)}
             )
 
+    def _type_index_key(self, biometric_type: BiometricType) -> str:
+        """Set of user ids enrolled for a biometric type"""
+        return f"{self.biometric_prefix}:type_index:{biometric_type.value}"
+
+    def _index_template(self, pipe, user_id: str, biometric_type: BiometricType):
+        """Queue the type index update for a stored template"""
+        index_key = self._type_index_key(biometric_type)
+        pipe.sadd(index_key, user_id)
+        pipe.expire(index_key, TEMPLATE_TTL)
+
     def calculate_similarity(self, input_data: str, template_data: str) -> float:
         """Calculate similarity between input and template data"""
         # In production, this would use actual biometric matching algorithms
@@ -218,12 +239,16 @@ class BiometricAuthService:
     async def remove_biometric(self, user_id: str, biometric_type: BiometricType) -> bool:
         """Remove user's biometric enrollment"""
         try:
+            pipe = self.redis_client.pipeline(transaction=False)
+
             # Remove template
-            await self.redis_client.delete(f"{self.biometric_prefix}:template:{user_id}:{biometric_type.value}")
-            
-            # Remove from user's biometric types
-            self.redis_client.srem(f"{self.biometric_prefix}:user_biometrics:{user_id}", biometric_type.value)
-            
+            pipe.delete(f"{self.biometric_prefix}:template:{user_id}:{biometric_type.value}")
+
+            # Remove from user's biometric types and the type index
+            pipe.srem(f"{self.biometric_prefix}:user_biometrics:{user_id}", biometric_type.value)
+            pipe.srem(self._type_index_key(biometric_type), user_id)
+
+            await pipe.execute()
             return True
         except Exception as e:
             print(f"Remove biometric error: {e}")
@@ -251,13 +276,18 @@ class BiometricAuthService:
                 last_updated=time.time()
             )
 
+            pipe = self.redis_client.pipeline(transaction=False)
+
             # Store updated template in Redis
-            await self.redis_client.setex(
+            pipe.setex(
                 f"{self.biometric_prefix}:template:{user_id}:{biometric_type.value}",
-                86400 * 365,  # 1 year
+                TEMPLATE_TTL,
                 json.dumps(asdict(template), default=str)
             )
 
+            self._index_template(pipe, user_id, biometric_type)
+            await pipe.execute()
+
             return True
 
         except Exception as e:
@@ -270,7 +300,7 @@ class BiometricAuthService:
         try:
             # Get total enrolled users
             pattern = f"{self.biometric_prefix}:user_biometrics:*"
-            user_keys = await self.redis_client.keys(pattern)
+            user_keys = [key async for key in self.redis_client.scan_iter(match=pattern, count=500)]
             
             # Get biometric distribution
             biometric_distribution = {}
@@ -7,6 +7,7 @@ import json
 import time
 import secrets
 import hashlib
+import orjson
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -267,43 +268,34 @@ class OAuth2ProviderService:
     async def store_token(self, client_id: str, token: OAuth2Token):
         """Store OAuth2 token"""
         try:
+            # Both writes are independent, so ship them in one round trip
+            pipe = self.redis_client.pipeline(transaction=False)
+
             # Store token with expiration
-            await self.redis_client.setex(
+            pipe.setex(
                 f"{self.oauth2_prefix}:token:{client_id}:{token.access_token}",
                 token.expires_in,
-                json.dumps(asdict(token), default=str)
+                orjson.dumps(asdict(token), default=str)
             )
 
             # Store refresh token mapping
             if token.refresh_token:
-                await self.redis_client.setex(
+                pipe.setex(
                     f"{self.oauth2_prefix}:refresh:{token.refresh_token}",
                     86400 * 30,  # 30 days
                     token.access_token
                 )
 
+            await pipe.execute()
+
         except Exception as e:
             print(f"Token storage error: {e}")
 
     async def validate_token(self, client_id: str, access_token: str) -> bool:
         """Validate access token"""
         try:
-            # Get token from Redis
-            token_data = await self.redis_client.get(f"{self.oauth2_prefix}:token:{client_id}:{access_token}")
-            
-            if not token_data:
-                return False
-
-            # Parse token
-            token_info = OAuth2Token(**json.loads(token_data))
-            
-            # Check if token is expired
-            if time.time() - token_info.created_at > token_info.expires_in:
-                # Remove expired token
-                await self.redis_client.delete(f"{self.oauth2_prefix}:token:{client_id}:{access_token}")
-                return False
-
-            return True
+            # Tokens are stored with SETEX expires_in, so Redis drops them on expiry
+            return bool(await self.redis_client.exists(f"{self.oauth2_prefix}:token:{client_id}:{access_token}"))
 
         except Exception as e:
             print(f"Token validation error: {e}")
@@ -7,11 +7,12 @@ import json
 import time
 import hashlib
 import secrets
+import orjson
 from typing import Dict, Any, List, Optional, Set
 from dataclasses import dataclass, asdict
 from enum import Enum
 
-from ..Redis.client import get_redis_client
+from ..Redis.client import get_redis_client, get_raw_redis_client
 
 
 class SecurityClassification(Enum):
@@ -55,6 +56,8 @@ class UltraSecurityService:
 
     def __init__(self):
         self.redis_client = get_redis_client()
+        # Serialized payloads are read as bytes and handed straight to orjson
+        self.raw_redis_client = get_raw_redis_client()
         self.security_prefix = "ultra_security"
 
         # Security statistics
@@ -275,7 +278,7 @@ class UltraSecurityService:
         try:
             # Get user behavior history
             behavior_key = f"{self.security_prefix}:user_behavior:{user_id}"
-            behavior_data = await self.redis_client.lrange(behavior_key, 0, -1)
+            behavior_data = await self.raw_redis_client.lrange(behavior_key, 0, -1)
 
             if not behavior_data:
                 return 0.1  # Low risk for new users
@@ -288,7 +291,7 @@ class UltraSecurityService:
             unusual_days = 0
 
             for entry in behavior_data[-50:]:  # Last 50 activities
-                activity = json.loads(entry)
+                activity = orjson.loads(entry)
 
                 # Check for unusual access hours
                 if abs(activity.get("hour", current_hour) - current_hour) > 6:
@@ -347,16 +350,15 @@ class UltraSecurityService:
             # Generate device fingerprint
             fingerprint = hashlib.md5(user_agent.encode()).hexdigest()
 
-            # Store device fingerprint
+            # Store device fingerprint; SADD reports whether it was new, SCARD the device count
             fingerprint_key = f"{self.security_prefix}:device_fingerprint:{user_id}"
-            stored_fingerprints = await self.redis_client.smembers(fingerprint_key)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.sadd(fingerprint_key, fingerprint)
+            pipe.scard(fingerprint_key)
+            added, device_count = await pipe.execute()
 
-            if fingerprint not in stored_fingerprints:
-                # New device detected
-                await self.redis_client.sadd(fingerprint_key, fingerprint)
-
-                # Risk based on number of known devices
-                device_count = len(stored_fingerprints) + 1
+            if added:
+                # New device detected; risk based on number of known devices
                 return min(0.8, device_count * 0.2)  # More devices = higher risk
 
             return 0.1  # Known device
@@ -402,7 +404,7 @@ class UltraSecurityService:
             await self.redis_client.setex(
                 f"{self.security_prefix}:session:{session_id}",
                 3600,  # 1 hour
-                json.dumps(session_data, default=str)
+                orjson.dumps(session_data, default=str)
             )
 
             return session_id
@@ -415,12 +417,12 @@ class UltraSecurityService:
         """Validate and refresh session"""
         try:
             # Get session
-            session_data = await self.redis_client.get(f"{self.security_prefix}:session:{session_id}")
+            session_data = await self.raw_redis_client.get(f"{self.security_prefix}:session:{session_id}")
 
             if not session_data:
                 return {"valid": False, "reason": "session_not_found"}
 
-            session_info = json.loads(session_data)
+            session_info = orjson.loads(session_data)
 
             # Check if session is expired
             if time.time() - session_info["created_at"] > 3600:
@@ -440,7 +442,7 @@ class UltraSecurityService:
             await self.redis_client.setex(
                 f"{self.security_prefix}:session:{session_id}",
                 3600,
-                json.dumps(session_info, default=str)
+                orjson.dumps(session_info, default=str)
             )
 
             return {
@@ -55,6 +55,12 @@ class ServiceMesh:
         self.service_registry: Dict[str, List[ServiceInstance]] = {}
         self.heartbeat_interval = 30  # seconds
 
+        # Routing reads instances through a short local cache: service_name -> (monotonic ts, instances)
+        self.instances_cache_ttl = 1.0  # seconds
+        self._instances_cache: Dict[str, tuple] = {}
+        # service_name -> in-flight Redis read shared by concurrent cache misses
+        self._instances_inflight: Dict[str, asyncio.Future] = {}
+
         # Circuit breaker states
         self.circuit_breakers: Dict[str, CircuitBreakerState] = {}
 
@@ -89,19 +95,24 @@ class ServiceMesh:
         )
 
         try:
+            pipe = self.redis_client.pipeline(transaction=False)
+
             # Store instance data
-            await self.redis_client.setex(
+            pipe.setex(
                 f"{self.mesh_prefix}:instance:{instance_id}",
                 86400,  # 24 hours
                 json.dumps(asdict(instance), default=str)
             )
 
             # Add to service registry
-            await self.redis_client.sadd(
+            pipe.sadd(
                 f"{self.mesh_prefix}:service:{service_name}",
                 instance_id
             )
 
+            await pipe.execute()
+            self._instances_cache.pop(service_name, None)
+
             # Update statistics
             if service_name not in [inst.service_name for instances in self.service_registry.values() for inst in instances]:
                 self.stats["services_registered"] += 1
@@ -122,14 +133,19 @@ class ServiceMesh:
             if instance_data:
                 instance = ServiceInstance(**json.loads(instance_data))
 
+                pipe = self.redis_client.pipeline(transaction=False)
+
                 # Remove from service registry
-                await self.redis_client.srem(
+                pipe.srem(
                     f"{self.mesh_prefix}:service:{instance.service_name}",
                     instance_id
                 )
 
                 # Remove instance data
-                await self.redis_client.delete(f"{self.mesh_prefix}:instance:{instance_id}")
+                pipe.delete(f"{self.mesh_prefix}:instance:{instance_id}")
+
+                await pipe.execute()
+                self._instances_cache.pop(instance.service_name, None)
 
                 return True
 
@@ -175,10 +191,15 @@ class ServiceMesh:
             instance_ids = await self.redis_client.smembers(f"{self.mesh_prefix}:service:{service_name}")
 
             instances = []
+            if not instance_ids:
+                return instances
 
-            for instance_id in instance_ids:
-                instance_data = await self.redis_client.get(f"{self.mesh_prefix}:instance:{instance_id}")
+            # One MGET for every instance instead of a GET round trip each
+            instance_values = await self.redis_client.mget(
+                [f"{self.mesh_prefix}:instance:{instance_id}" for instance_id in instance_ids]
+            )
 
+            for instance_data in instance_values:
                 if instance_data:
                     instance = ServiceInstance(**json.loads(instance_data))
 
@@ -203,7 +224,7 @@ class ServiceMesh:
     ) -> Optional[ServiceInstance]:
         """Route request to service instance using specified strategy"""
         try:
-            instances = await self.get_service_instances(service_name)
+            instances = await self._get_routable_instances(service_name)
 
             if not instances:
                 return None
@@ -229,6 +250,29 @@ class ServiceMesh:
             print(f"Request routing error: {e}")
             return None
 
+    async def _get_routable_instances(self, service_name: str) -> List[ServiceInstance]:
+        """Service instances for routing, re-read from Redis at most once per instances_cache_ttl"""
+        now = time.monotonic()
+        cached = self._instances_cache.get(service_name)
+        if cached is not None and now - cached[0] < self.instances_cache_ttl:
+            return cached[1]
+
+        # Single-flight: concurrent misses for a service share one Redis read
+        inflight = self._instances_inflight.get(service_name)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        inflight = self._instances_inflight[service_name] = asyncio.ensure_future(
+            self.get_service_instances(service_name)
+        )
+        try:
+            instances = await asyncio.shield(inflight)
+        finally:
+            if self._instances_inflight.get(service_name) is inflight:
+                del self._instances_inflight[service_name]
+        self._instances_cache[service_name] = (now, instances)
+        return instances
+
     async def round_robin_routing(self, instances: List[ServiceInstance]) -> ServiceInstance:
         """Round-robin load balancing"""
         # Simple round-robin using Redis counter
@@ -311,7 +355,7 @@ class ServiceMesh:
         try:
             # Get all services
             pattern = f"{self.mesh_prefix}:service:*"
-            service_keys = await self.redis_client.keys(pattern)
+            service_keys = [key async for key in self.redis_client.scan_iter(match=pattern, count=500)]
 
             services = {}
 
@@ -362,14 +406,14 @@ class ServiceMesh:
         try:
             # Get all instances
             pattern = f"{self.mesh_prefix}:instance:*"
-            instance_keys = await self.redis_client.keys(pattern)
+            instance_keys = [key async for key in self.redis_client.scan_iter(match=pattern, count=500)]
 
             load_distribution = []
             service_load = {}
 
-            for instance_key in instance_keys:
-                instance_data = await self.redis_client.get(instance_key)
+            instance_values = await self.redis_client.mget(instance_keys) if instance_keys else []
 
+            for instance_data in instance_values:
                 if instance_data:
                     instance = ServiceInstance(**json.loads(instance_data))
 
@@ -476,26 +520,46 @@ class ServiceMesh:
         """Clean up instances that haven't sent heartbeat"""
         try:
             pattern = f"{self.mesh_prefix}:instance:*"
-            instance_keys = await self.redis_client.keys(pattern)
+            now = time.time()
+            dead_instances = []
+            batch = []
+
+            # SCAN walks the keyspace in steps instead of blocking Redis like KEYS
+            async for instance_key in self.redis_client.scan_iter(match=pattern, count=500):
+                batch.append(instance_key)
+                if len(batch) >= 500:
+                    dead_instances.extend(await self._find_dead_instances(batch, now))
+                    batch = []
+            if batch:
+                dead_instances.extend(await self._find_dead_instances(batch, now))
+
+            if dead_instances:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for instance in dead_instances:
+                    pipe.srem(f"{self.mesh_prefix}:service:{instance.service_name}", instance.instance_id)
+                    # UNLINK frees the value in a Redis background thread
+                    pipe.unlink(f"{self.mesh_prefix}:instance:{instance.instance_id}")
+                    self._instances_cache.pop(instance.service_name, None)
+                await pipe.execute()
+
+            return len(dead_instances)
 
-            cleaned = 0
-
-            for instance_key in instance_keys:
-                instance_data = await self.redis_client.get(instance_key)
+        except Exception as e:
+            print(f"Instance cleanup error: {e}")
+            return 0
 
-                if instance_data:
-                    instance = ServiceInstance(**json.loads(instance_data))
+    async def _find_dead_instances(self, instance_keys: List[str], now: float) -> List[ServiceInstance]:
+        """Instances among instance_keys with no heartbeat for 2 minutes"""
+        dead_instances = []
 
-                    # Check if instance is dead (no heartbeat for 2 minutes)
-                    if time.time() - instance.last_heartbeat > 120:
-                        await self.unregister_service(instance.instance_id)
-                        cleaned += 1
+        for instance_data in await self.redis_client.mget(instance_keys):
+            if instance_data:
+                instance = ServiceInstance(**json.loads(instance_data))
 
-            return cleaned
+                if now - instance.last_heartbeat > 120:
+                    dead_instances.append(instance)
 
-        except Exception as e:
-            print(f"Instance cleanup error: {e}")
-            return 0
+        return dead_instances
 
     async def update_circuit_breakers(self) -> None:
         """Update circuit breaker states"""
@@ -512,7 +576,7 @@ class ServiceMesh:
         """Perform health checks on all services"""
         try:
             pattern = f"{self.mesh_prefix}:service:*"
-            service_keys = await self.redis_client.keys(pattern)
+            service_keys = [key async for key in self.redis_client.scan_iter(match=pattern, count=500)]
 
             for service_key in service_keys:
                 service_name = service_key.split(":")[-1]
@@ -79,19 +79,23 @@ class ServiceRegistry:
                 version=version
             )
 
+            pipe = self.redis_client.pipeline(transaction=False)
+
             # Store in Redis
-            await self.redis_client.setex(
+            pipe.setex(
                 f"{self.registry_prefix}:service:{service_id}",
                 86400,  # 24 hours
                 json.dumps(asdict(registration), default=str)
             )
 
             # Add to service set
-            await self.redis_client.sadd(
+            pipe.sadd(
                 f"{self.registry_prefix}:services:{service_name}",
                 service_id
             )
 
+            await pipe.execute()
+
             # Update local cache
             self.registered_services[service_id] = registration
             self.stats["services_registered"] += 1
@@ -110,13 +114,14 @@ class ServiceRegistry:
             if not registration:
                 return False
 
-            # Remove from Redis
-            await self.redis_client.srem(
+            # Remove from Redis in one round trip
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.srem(
                 f"{self.registry_prefix}:services:{registration.service_name}",
                 service_id
             )
-
-            await self.redis_client.delete(f"{self.registry_prefix}:service:{service_id}")
+            pipe.delete(f"{self.registry_prefix}:service:{service_id}")
+            await pipe.execute()
 
             # Remove from local cache
             del self.registered_services[service_id]
@@ -256,7 +261,7 @@ class ServiceRegistry:
         try:
             # Get all service names
             pattern = f"{self.registry_prefix}:services:*"
-            service_keys = await self.redis_client.keys(pattern)
+            service_keys = [key async for key in self.redis_client.scan_iter(match=pattern, count=500)]
 
             services = {}
 
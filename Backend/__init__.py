@@ -3,43 +3,61 @@ SEC Backend Package
 Organized backend services for the SEC application.
 """
 
-# AI Services
-from .AI import UltraAIService, AIProvider, AIModel, PredictionRequest, PredictionResult, ultra_ai_service
-from .AI.nlp import AdvancedNLPService, NLPAnalysisType, NLPAnalysisRequest, advanced_nlp_service
-from .AI.multimedia import MultimediaContentGenerationService, MediaType, ContentGenerationType, ContentGenerationRequest, multimedia_content_service
-from .AI.analysis import SentimentBehaviorAnalysisService, AnalysisType, SentimentType, BehaviorPattern, AnalysisRequest, sentiment_behavior_service
+import importlib
 
-# Security Services
-from .Security import UltraSecurityService, SecurityClassification, ThreatLevel, ultra_security_service
-from .Security.oauth2 import OAuth2ProviderService, OAuth2Provider, OAuth2Client, OAuth2Token, oauth2_provider
-from .Security.biometric import BiometricAuthService, BiometricType, BiometricSecurityLevel, BiometricTemplate, BiometricAuthenticationResult, biometric_auth
-from .Security.encryption import DataEncryptionService, EncryptionAlgorithm, KeyType, EncryptionKey, EncryptedData, data_encryption
+# Services are imported on first access (PEP 562): importing one subpackage,
+# e.g. Backend.Redis.client, no longer drags in every service and its clients.
+# name -> subpackage that exports it
+_LAZY_EXPORTS = {
+    # AI Services
+    "UltraAIService": ".AI", "AIProvider": ".AI", "AIModel": ".AI", "PredictionRequest": ".AI", "PredictionResult": ".AI", "ultra_ai_service": ".AI",
+    "AdvancedNLPService": ".AI.nlp", "NLPAnalysisType": ".AI.nlp", "NLPAnalysisRequest": ".AI.nlp", "advanced_nlp_service": ".AI.nlp",
+    "MultimediaContentGenerationService": ".AI.multimedia", "MediaType": ".AI.multimedia", "ContentGenerationType": ".AI.multimedia", "ContentGenerationRequest": ".AI.multimedia", "multimedia_content_service": ".AI.multimedia",
+    "SentimentBehaviorAnalysisService": ".AI.analysis", "AnalysisType": ".AI.analysis", "SentimentType": ".AI.analysis", "BehaviorPattern": ".AI.analysis", "AnalysisRequest": ".AI.analysis", "sentiment_behavior_service": ".AI.analysis",
+
+    # Security Services
+    "UltraSecurityService": ".Security", "SecurityClassification": ".Security", "ThreatLevel": ".Security", "ultra_security_service": ".Security",
+    "OAuth2ProviderService": ".Security.oauth2", "OAuth2Provider": ".Security.oauth2", "OAuth2Client": ".Security.oauth2", "OAuth2Token": ".Security.oauth2", "oauth2_provider": ".Security.oauth2",
+    "BiometricAuthService": ".Security.biometric", "BiometricType": ".Security.biometric", "BiometricSecurityLevel": ".Security.biometric", "BiometricTemplate": ".Security.biometric", "BiometricAuthenticationResult": ".Security.biometric", "biometric_auth": ".Security.biometric",
+    "DataEncryptionService": ".Security.encryption", "EncryptionAlgorithm": ".Security.encryption", "KeyType": ".Security.encryption", "EncryptionKey": ".Security.encryption", "EncryptedData": ".Security.encryption", "data_encryption": ".Security.encryption",
+
+    # Analytics Services
+    "UltraAnalyticsService": ".Analytics", "AnalyticsScope": ".Analytics", "ultra_analytics_service": ".Analytics",
+    "BusinessIntelligenceService": ".Analytics", "business_intelligence_service": ".Analytics",
+    "BusinessIntelligenceDashboardService": ".Analytics.bi", "DashboardType": ".Analytics.bi", "VisualizationType": ".Analytics.bi", "bi_dashboard_service": ".Analytics.bi",
+
+    # Redis Client
+    "get_redis_client": ".Redis", "close_redis_connection": ".Redis", "test_redis_connection": ".Redis",
 
-# Analytics Services
-from .Analytics import UltraAnalyticsService, AnalyticsScope, ultra_analytics_service
-from .Analytics import BusinessIntelligenceService, business_intelligence_service
-from .Analytics.bi import BusinessIntelligenceDashboardService, DashboardType, VisualizationType, bi_dashboard_service
+    # Service Mesh
+    "ServiceMesh": ".Service_Mesh", "ServiceStatus": ".Service_Mesh", "service_mesh": ".Service_Mesh",
 
-# Redis Client
-from .Redis import get_redis_client, close_redis_connection, test_redis_connection
+    # Message Broker
+    "HybridMessageBroker": ".Message_Broker", "MessageBrokerType": ".Message_Broker", "MessagePriority": ".Message_Broker", "hybrid_broker": ".Message_Broker", "message_handler": ".Message_Broker",
 
-# Service Mesh
-from .Service_Mesh import ServiceMesh, ServiceStatus, service_mesh
+    # API Gateway
+    "APIGateway": ".API_Gateway", "api_gateway": ".API_Gateway",
 
-# Message Broker
-from .Message_Broker import HybridMessageBroker, MessageBrokerType, MessagePriority, hybrid_broker, message_handler
+    # Service Registry
+    "ServiceRegistry": ".Service_Registry", "service_registry": ".Service_Registry",
 
-# API Gateway
-from .API_Gateway import APIGateway, api_gateway
+    # Event-Driven Architecture
+    "EventDrivenSystem": ".Event_Driven", "EventType": ".Event_Driven", "SagaStatus": ".Event_Driven", "event_driven_system": ".Event_Driven",
+
+    # Service Registration
+    "ServiceRegistration": ".Service_Registration", "service_registration": ".Service_Registration", "register_current_service": ".Service_Registration", "unregister_current_service": ".Service_Registration",
+}
 
-# Service Registry
-from .Service_Registry import ServiceRegistry, service_registry
 
-# Event-Driven Architecture
-from .Event_Driven import EventDrivenSystem, EventType, SagaStatus, event_driven_system
+def __getattr__(name):
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
 
-# Service Registration
-from .Service_Registration import ServiceRegistration, service_registration, register_current_service, unregister_current_service
 
 __all__ = [
     # AI Services